@@ -0,0 +1,123 @@
+"""
+Asyncio crawler for lawyer detail pages.
+Keeps many requests in flight on a single thread while holding every
+host to a configurable requests-per-second ceiling.
+"""
+import asyncio
+import time
+from urllib.parse import urlsplit
+import aiohttp
+from scraper import BROWSER_HEADERS, page_encoding, parse_lawyer_details
+
+ASYNC_CONCURRENCY = 20  # Maximum detail requests in flight at once
+ASYNC_RATE_LIMIT = 5.0  # Maximum requests per second to each host
+ASYNC_RETRIES = 2  # Extra attempts for timeouts and retryable status codes
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Token bucket that lets `rate` requests per second through, with bursts up to `capacity`"""
+    
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class AsyncDetailCrawler:
+    """Fetch and parse detail pages concurrently over one shared connection pool
+
+    The event loop and the aiohttp session live for the whole crawl, so
+    connections are reused from one results page to the next.
+    """
+    
+    def __init__(self, concurrency=ASYNC_CONCURRENCY, rate=ASYNC_RATE_LIMIT, cookies=None, retries=ASYNC_RETRIES):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.retries = retries
+        self._loop = asyncio.new_event_loop()
+        self._buckets = {}
+        self._semaphore = None
+        self._session = self._loop.run_until_complete(self._open_session(cookies))
+    
+    async def _open_session(self, cookies):
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        # aiohttp only decodes brotli when the optional brotli package is installed
+        headers = dict(BROWSER_HEADERS, **{'Accept-Encoding': 'gzip, deflate'})
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            cookies=cookies,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    
+    def _bucket_for(self, url):
+        """Return the rate limiter of the url's host"""
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate)
+        return self._buckets[host]
+    
+    async def _fetch(self, url):
+        """Fetch and parse one detail page, returning None on failure"""
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                await self._bucket_for(url).acquire()
+                try:
+                    async with self._session.get(url, allow_redirects=True) as response:
+                        if response.status == 200:
+                            content = await response.read()
+                            encoding = page_encoding(response.headers.get('Content-Type'), content)
+                            return parse_lawyer_details(content, encoding)
+                        if response.status not in RETRY_STATUS_CODES:
+                            print(f"   ⚠ Detail page returned status code: {response.status}")
+                            return None
+                        print(f"   ⚠ Detail page returned status code: {response.status} (attempt {attempt + 1})")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    print(f"   ⚠ Error fetching detail page (attempt {attempt + 1}): {e}")
+                except Exception as e:
+                    print(f"   ⚠ Error parsing detail page: {e}")
+                    return None
+                await asyncio.sleep(2 ** attempt)
+            return None
+    
+    async def _fetch_all(self, urls):
+        return await asyncio.gather(*(self._fetch(url) for url in urls))
+    
+    def update_cookies(self, cookies):
+        """Replace session cookies, e.g. with the latest cookies from a Selenium driver"""
+        self._session.cookie_jar.update_cookies(cookies)
+    
+    def fetch_all(self, urls):
+        """Fetch and parse all urls concurrently; results are in the same order as urls"""
+        if not urls:
+            return []
+        return self._loop.run_until_complete(self._fetch_all(urls))
+    
+    def close(self):
+        """Close the connection pool and the event loop"""
+        try:
+            self._loop.run_until_complete(self._session.close())
+        finally:
+            self._loop.close()
+
+def driver_cookies(driver):
+    """Return a Selenium driver's cookies as a name -> value dict"""
+    try:
+        return {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+    except Exception as e:
+        print(f"⚠ Could not copy browser cookies: {e}")
+        return {}
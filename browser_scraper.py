@@ -10,24 +10,144 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException, StaleElementReferenceException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 import os
 import re
+import queue
+import atexit
+from urllib.parse import unquote
+import threading
 from datetime import datetime
-from openpyxl import Workbook, load_workbook
-from openpyxl.styles import Font, Alignment
-import gspread
-from google.oauth2.service_account import Credentials
+try:
+    import psutil  # In requirements.txt; without it ManagedDriver cannot recycle Chrome by memory use
+except ImportError:
+    psutil = None
+from scraper import session_from_driver, sync_session_cookies, fetch_lawyer_details
+from async_crawler import AsyncDetailCrawler, driver_cookies, ASYNC_CONCURRENCY, ASYNC_RATE_LIMIT
+from crawl_state import CrawlState, STATUS_FAILED
+from lawyer_store import get_store, lawyer_id_from_url
+from lawyer_file import scan_lawyer_file
+from sinks import GoogleSheetsSink, TextFileSink, ExcelSink, PersistencePipeline
 
 # Google Sheets configuration
 GOOGLE_SHEETS_ID = "1yTXRHCG5VdnK4q_2smRMuGazCgMSnwjbSQpRPnLzCIA"
 START_FROM_LAWYER_NUMBER = 30  # Start from lawyer #30 (for testing)
-_google_sheets_warning_shown = False  # Track if warning was already shown
+DETAIL_WORKERS = 4  # Number of Chrome drivers fetching detail pages in parallel mode
+WAIT_TIMEOUT = 15  # Default seconds to wait for a page readiness signal
+RESULTS_PER_PAGE = 20  # Results per page (chunckStart advances by this much per page)
+RESULTS_SELECTOR = "div.lawyers-search-results_item, .lawyers-search-results_item"
 
-def create_driver(download_dir=None, headless=True):
-    """Create a Chrome WebDriver instance"""
+# Business area options to select (matching exact text from dropdown)
+BUSINESS_OPTIONS = [
+    "מקרקעין/נדל\"ן",  # Fixed: forward slash, not backslash
+    "תיווך",
+    "אדריכלות",
+    "יזמות",
+    "ליקויי בניה",
+    "מיסוי מקרקעין",
+    "שכירות",
+    "תיווך",  # Duplicate as per original list
+    "הגנת הדייר",
+    "חוזים",
+    "ירושות, צוואות ועזבונות",  # Fixed: with commas
+    "מכרזים",
+    "מלונאות",
+    "רשויות מקומיות"
+]
+_sheets_sinks = {}  # sheet id -> GoogleSheetsSink, see get_sheets_sink()
+_sheets_sinks_lock = threading.Lock()
+_pipelines = {}  # text filename -> PersistencePipeline, see get_persistence()
+_pipelines_lock = threading.Lock()
+FAST_MODE = False  # Skip scroll animation, highlighting and element introspection when clicking
+_crawl_state = None  # Opened on first use by get_crawl_state()
+
+# ChromeDriver binary: CHROMEDRIVER_PATH wins, then the path cached on disk by an
+# earlier run, then webdriver-manager (which may need the network)
+CHROMEDRIVER_PATH_ENV = "CHROMEDRIVER_PATH"
+CHROMEDRIVER_CACHE_FILE = ".chromedriver_path"
+_driver_path = None  # Resolved once per process by get_chromedriver_path()
+_driver_path_lock = threading.Lock()
+
+# Browser recycling for long crawls, see ManagedDriver
+RECYCLE_AFTER_PAGES = 50  # Start a fresh browser after this many results pages
+RECYCLE_RSS_MB = 1500  # ...or when Chrome uses more memory than this (read with psutil)
+MAX_DRIVER_RESTARTS = 3  # Attempts to bring up a working browser before giving up
+
+# Lean browsing profile: resources the scraper never reads are not downloaded
+PAGE_LOAD_STRATEGY = "eager"  # Return from driver.get() at DOMContentLoaded, not after every image
+BLOCKED_URL_PATTERNS = [
+    # Images, fonts and media
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    # Third-party analytics, ads, social widgets and web fonts
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*facebook.com/tr*",
+    "*hotjar.com*", "*clarity.ms*", "*youtube.com*", "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*"
+]
+
+def get_chromedriver_path(refresh=False):
+    """Return the ChromeDriver binary path, resolving it at most once per process
+
+    Pass refresh=True to ignore the cached path (e.g. after Chrome updated and
+    the cached driver no longer matches) and ask webdriver-manager again.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path and not refresh:
+            return _driver_path
+        
+        env_path = os.getenv(CHROMEDRIVER_PATH_ENV)
+        if env_path:
+            _driver_path = env_path
+            return _driver_path
+        
+        cache_file = os.path.join(os.getcwd(), CHROMEDRIVER_CACHE_FILE)
+        if not refresh:
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    cached_path = f.read().strip()
+                if cached_path and os.access(cached_path, os.X_OK):
+                    _driver_path = cached_path
+                    return _driver_path
+            except OSError:
+                pass
+        
+        print("🔧 Resolving ChromeDriver (this may take a moment on first run)...")
+        _driver_path = ChromeDriverManager().install()
+        try:
+            with open(cache_file, "w", encoding="utf-8") as f:
+                f.write(_driver_path)
+        except OSError as e:
+            print(f"⚠ Could not cache the ChromeDriver path: {e}")
+        return _driver_path
+
+def block_resources(driver, patterns=None):
+    """Block requests matching the URL patterns in the current tab (via CDP)
+
+    The block list only applies to the tab that is current, so tabs opened
+    later call this again with driver.blocked_url_patterns.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
+        return True
+    except Exception as e:
+        print(f"⚠ Could not block resources: {e}")
+        return False
+
+def create_driver(download_dir=None, headless=True, lean=None):
+    """Create a Chrome WebDriver instance
+
+    With lean (the default in headless mode), images, fonts, media and known
+    third-party hosts are not loaded and driver.get() returns once the DOM
+    is ready, since the scraper only reads text from the page.
+    """
+    if lean is None:
+        lean = headless
     chrome_options = Options()
     
     # Run in headless mode for server deployment (Vercel)
@@ -64,15 +184,28 @@ def create_driver(download_dir=None, headless=True):
         "download.directory_upgrade": True,
         "safebrowsing.enabled": True
     }
+    if lean:
+        # Belt and braces with the CDP block list below: images are off at the profile level too
+        prefs["profile.managed_default_content_settings.images"] = 2
+        chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--mute-audio')
     chrome_options.add_experimental_option("prefs", prefs)
     
     try:
-        print("🔧 Setting up ChromeDriver (this may take a moment on first run)...")
-        # Use webdriver-manager to automatically download and manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        try:
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=chrome_options)
+        except SessionNotCreatedException:
+            if os.getenv(CHROMEDRIVER_PATH_ENV):
+                raise
+            # The cached driver probably no longer matches the installed Chrome
+            print("⚠ Cached ChromeDriver does not match Chrome, resolving it again...")
+            driver = webdriver.Chrome(service=Service(get_chromedriver_path(refresh=True)), options=chrome_options)
         # Execute script to remove webdriver property
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if lean and block_resources(driver):
+            driver.blocked_url_patterns = BLOCKED_URL_PATTERNS  # For tabs opened later
+            print("✓ Lean profile: images, fonts, media and third-party hosts blocked")
         print("✓ ChromeDriver ready")
         print(f"✓ Download directory: {download_dir}")
         return driver
@@ -84,8 +217,91 @@ def create_driver(download_dir=None, headless=True):
         print(f"✗ Unexpected error: {e}")
         return None
 
+def wait_for(driver, condition, timeout=None, description="page"):
+    """Wait until condition(driver) is truthy and return its value, or None on timeout"""
+    timeout = timeout or WAIT_TIMEOUT
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(condition)
+    except TimeoutException:
+        print(f"   ⚠ Timed out after {timeout}s waiting for {description}")
+        return None
+
+def wait_for_page_ready(driver, timeout=None):
+    """Wait until the document has finished loading"""
+    return wait_for(
+        driver,
+        lambda d: d.execute_script("return document.readyState") == "complete",
+        timeout,
+        "page load"
+    )
+
+def wait_for_results(driver, timeout=None):
+    """Wait until lawyer result cards are present on the page"""
+    return wait_for(
+        driver,
+        EC.presence_of_all_elements_located((By.CSS_SELECTOR, RESULTS_SELECTOR)),
+        timeout,
+        "search results"
+    )
+
+def wait_for_results_change(driver, old_item, timeout=None):
+    """Wait until the given result card is replaced and new result cards are present"""
+    try:
+        old_text = old_item.text
+    except StaleElementReferenceException:
+        old_text = None
+    
+    def results_changed(d):
+        try:
+            return old_text is None or old_item.text != old_text
+        except StaleElementReferenceException:
+            return True
+    
+    if not wait_for(driver, results_changed, timeout, "results page to change"):
+        return None
+    return wait_for_results(driver, timeout)
+
+def wait_for_detail(driver, timeout=None):
+    """Wait until the labelled detail spans (or the page title) are present"""
+    return wait_for(
+        driver,
+        EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "span.title")),
+            EC.presence_of_element_located((By.TAG_NAME, "h1"))
+        ),
+        timeout,
+        "detail page"
+    )
+
+def get_label_checkbox(driver, label):
+    """Return the checkbox a label is attached to, or None"""
+    try:
+        checkbox_id = label.get_attribute("for")
+        if checkbox_id:
+            return driver.find_element(By.ID, checkbox_id)
+    except Exception:
+        pass
+    return None
+
+def wait_for_toggle(driver, checkbox, was_selected, timeout=2):
+    """Wait until a checkbox's selected state differs from was_selected"""
+    return wait_for(
+        driver,
+        lambda d: checkbox.is_selected() != was_selected,
+        timeout,
+        "checkbox to toggle"
+    )
+
+def set_fast_mode(enabled):
+    """Turn the production fast mode on or off for all interaction helpers"""
+    global FAST_MODE
+    FAST_MODE = enabled
+    print(f"⚡ Fast mode {'enabled' if enabled else 'disabled'}")
+
 def highlight_element(driver, element, duration=1):
-    """Highlight an element with a red border"""
+    """Highlight an element with a red border (no-op in fast mode)"""
+    if FAST_MODE:
+        return
     try:
         # Store original style
         original_style = element.get_attribute('style')
@@ -113,7 +329,22 @@ def highlight_element(driver, element, duration=1):
         print(f"Error highlighting element: {e}")
 
 def click_and_show(driver, element, description="Element"):
-    """Click an element and show what was clicked"""
+    """Click an element and show what was clicked
+
+    In fast mode the element is clicked directly, with a JavaScript click as fallback.
+    """
+    if FAST_MODE:
+        print(f"\n🖱️  Clicking: {description}")
+        try:
+            try:
+                element.click()
+            except WebDriverException:
+                driver.execute_script("arguments[0].click();", element)
+            return True
+        except Exception as e:
+            print(f"   ✗ Error clicking: {e}")
+            return False
+    
     try:
         print(f"\n🖱️  Clicking: {description}")
         
@@ -135,13 +366,10 @@ def click_and_show(driver, element, description="Element"):
         print(f"   ID: {element_id}")
         print(f"   Class: {element_class}")
         
-        # Click the element
+        # Click the element; callers wait for their own readiness signal
         element.click()
         print(f"   ✓ Clicked successfully!")
         
-        # Wait a bit after click
-        time.sleep(1)
-        
         return True
     except Exception as e:
         print(f"   ✗ Error clicking: {e}")
@@ -179,7 +407,9 @@ def click_close_button(driver):
             print("✓ Found close button!")
             if click_and_show(driver, close_button, "Close Button (סגירה)"):
                 print("✓ Close button clicked successfully!")
-                time.sleep(2)  # Wait for any popup/modal to close
+                # Wait for the popup/modal to close and the postback to finish
+                wait_for(driver, EC.invisibility_of_element(close_button), description="popup to close")
+                wait_for_page_ready(driver)
                 return True
             else:
                 print("✗ Failed to click close button")
@@ -208,7 +438,12 @@ def open_business_area_dropdown(driver):
             print("✓ Found business area dropdown button!")
             if click_and_show(driver, dropdown_button, "Business Area Dropdown (תחומי עיסוק)"):
                 print("✓ Dropdown opened!")
-                time.sleep(1.5)  # Wait for dropdown to open
+                # Wait for the first option to become visible
+                wait_for(
+                    driver,
+                    EC.visibility_of_element_located((By.XPATH, f"//label[contains(normalize-space(), '{BUSINESS_OPTIONS[0]}')]")),
+                    description="dropdown options"
+                )
                 return True
             else:
                 print("✗ Failed to open dropdown")
@@ -230,29 +465,17 @@ def select_business_options(driver):
     print("🔍 Selecting business options...")
     print("="*60)
     
-    # List of options to select (matching exact text from dropdown)
-    options_to_select = [
-        "מקרקעין/נדל\"ן",  # Fixed: forward slash, not backslash
-        "תיווך",
-        "אדריכלות",
-        "יזמות",
-        "ליקויי בניה",
-        "מיסוי מקרקעין",
-        "שכירות",
-        "תיווך",  # Duplicate as per original list
-        "הגנת הדייר",
-        "חוזים",
-        "ירושות, צוואות ועזבונות",  # Fixed: with commas
-        "מכרזים",
-        "מלונאות",
-        "רשויות מקומיות"
-    ]
+    options_to_select = BUSINESS_OPTIONS
     
     selected_count = 0
     
     try:
         # Wait for dropdown content to be visible
-        time.sleep(1.5)
+        wait_for(
+            driver,
+            EC.visibility_of_element_located((By.XPATH, f"//label[contains(normalize-space(), '{options_to_select[0]}')]")),
+            description="dropdown options"
+        )
         
         # First, try to find all checkboxes in the dropdown
         try:
@@ -314,6 +537,8 @@ def select_business_options(driver):
                 # Click the found label element
                 if clickable and found:
                     print(f"\n   Selecting: {option_text}")
+                    checkbox = get_label_checkbox(driver, clickable)
+                    was_selected = checkbox.is_selected() if checkbox else None
                     highlight_element(driver, clickable, duration=0.5)
                     
                     # Try regular click first
@@ -330,7 +555,8 @@ def select_business_options(driver):
                     
                     selected_count += 1
                     print(f"   ✓ Selected: {option_text}")
-                    time.sleep(0.4)  # Small delay between selections
+                    if checkbox is not None:
+                        wait_for_toggle(driver, checkbox, was_selected)
                 else:
                     print(f"   ⚠ Option not found: {option_text}")
                     
@@ -339,7 +565,6 @@ def select_business_options(driver):
                 continue
         
         print(f"\n✓ Successfully selected {selected_count} out of {len(options_to_select)} options")
-        time.sleep(1)  # Wait after all selections
         return selected_count
         
     except Exception as e:
@@ -364,7 +589,8 @@ def click_search_button(driver):
             print("✓ Found search button!")
             if click_and_show(driver, search_button, "Search Button (חיפוש)"):
                 print("✓ Search button clicked successfully!")
-                time.sleep(3)  # Wait for search results to load
+                # Wait for search results to load
+                wait_for_results(driver)
                 return True
             else:
                 print("✗ Failed to click search button")
@@ -429,7 +655,8 @@ def extract_lawyer_cards(driver):
                         "name": full_name,
                         "hebrew_name": hebrew_name,
                         "english_name": english_name,
-                        "detail_link": detail_link
+                        "detail_link": detail_link,
+                        "lawyer_id": lawyer_id_from_url(detail_link)
                     })
                     print(f"   ✓ {full_name}")
                     
@@ -446,8 +673,11 @@ def extract_lawyer_cards(driver):
         traceback.print_exc()
         return lawyer_cards
 
-def extract_lawyer_details(driver, detail_url, results_url):
-    """Extract detailed information from a lawyer's detail page"""
+def extract_lawyer_details(driver, detail_url, results_url=None):
+    """Extract detailed information from a lawyer's detail page
+
+    If results_url is given, the driver navigates back to it afterwards.
+    """
     details = {
         "name": "",
         "area_of_practice": "",
@@ -459,7 +689,7 @@ def extract_lawyer_details(driver, detail_url, results_url):
     try:
         # Navigate to detail page
         driver.get(detail_url)
-        time.sleep(2)  # Wait for page to load
+        wait_for_detail(driver)
         
         # Extract name - look for h1 or title
         try:
@@ -527,21 +757,35 @@ def extract_lawyer_details(driver, detail_url, results_url):
                 pass
         
         # Go back to results page
-        driver.get(results_url)
-        time.sleep(2)
+        if results_url:
+            driver.get(results_url)
+            wait_for_results(driver)
         
         return details
         
     except Exception as e:
         print(f"   ⚠ Error extracting details: {e}")
         # Try to go back to results page even on error
-        try:
-            driver.get(results_url)
-            time.sleep(2)
-        except:
-            pass
+        if results_url:
+            try:
+                driver.get(results_url)
+                wait_for_results(driver)
+            except:
+                pass
         return details
 
+def get_lawyer_details(driver, detail_url, session=None, results_url=None):
+    """Get a lawyer's details over plain HTTP, falling back to the browser
+
+    The HTTP path is only used when a session is given.
+    """
+    if session is not None:
+        details = fetch_lawyer_details(session, detail_url)
+        if details:
+            return details
+        print("   ⚠ HTTP fetch failed, falling back to browser")
+    return extract_lawyer_details(driver, detail_url, results_url)
+
 def get_next_page_button(driver):
     """Find and return the next page button"""
     try:
@@ -569,9 +813,17 @@ def navigate_to_next_page(driver):
         
         if next_button:
             print("\n➡️  Navigating to next page...")
+            current_items = driver.find_elements(By.CSS_SELECTOR, RESULTS_SELECTOR)
             highlight_element(driver, next_button, duration=0.5)
             next_button.click()
-            time.sleep(3)  # Wait for page to load
+            # Wait for the old results to be replaced by the next page
+            if current_items:
+                changed = wait_for_results_change(driver, current_items[0])
+            else:
+                changed = wait_for_results(driver)
+            if not changed:
+                print("✗ Next page did not load")
+                return False
             return True
         else:
             print("\n⚠ No next page button found (reached last page)")
@@ -596,8 +848,7 @@ def get_total_pages(driver):
                 match = re.search(r'chunckStart=(\d+)', href)
                 if match:
                     last_chunk = int(match.group(1))
-                    # Assuming 20 results per page (based on chunckStart increments)
-                    total_pages = (last_chunk // 20) + 1
+                    total_pages = (last_chunk // RESULTS_PER_PAGE) + 1
                     return total_pages
         
         # Fallback: count page number links
@@ -609,14 +860,430 @@ def get_total_pages(driver):
     except:
         return None
 
-def extract_all_lawyer_details(driver, max_names=None, max_pages=None, resume_from_page=1, existing_count=0):
-    """Extract lawyer details from all pages by visiting each detail page"""
+def build_page_href(driver, page_num):
+    """Build the link to a results page by rewriting chunckStart in the "last" nav link"""
+    try:
+        last_page_link = driver.find_element(By.CSS_SELECTOR, "a.nav-btn.last")
+        href = last_page_link.get_attribute("href")
+    except:
+        return None
+    if not href or "chunckStart=" not in href:
+        return None
+    chunck_start = (page_num - 1) * RESULTS_PER_PAGE
+    return re.sub(r'chunckStart=\d+', f'chunckStart={chunck_start}', href)
+
+def first_result_text(driver):
+    """Return the text of the first result card on the page, or None"""
+    try:
+        items = driver.find_elements(By.CSS_SELECTOR, RESULTS_SELECTOR)
+        return items[0].text if items else None
+    except StaleElementReferenceException:
+        return None
+
+def seek_to_page(driver, page_num):
+    """Jump straight to a results page using a computed chunckStart link
+
+    Works for plain links and for javascript: postback links. Returns True if
+    the requested page was loaded.
+    """
+    if page_num <= 1:
+        return True
+    
+    href = build_page_href(driver, page_num)
+    if not href:
+        print("⚠ Pagination link with chunckStart not found, cannot seek")
+        return False
+    
+    print(f"\n⏩ Seeking directly to page {page_num}...")
+    current_items = driver.find_elements(By.CSS_SELECTOR, RESULTS_SELECTOR)
+    old_text = first_result_text(driver)
+    try:
+        if href.startswith("javascript:"):
+            driver.execute_script(unquote(href[len("javascript:"):]))
+        else:
+            driver.get(href)
+    except Exception as e:
+        print(f"✗ Error seeking to page {page_num}: {e}")
+        return False
+    
+    # A javascript: postback returns before the navigation, so wait for the
+    # old results to be replaced rather than for results to be present
+    if current_items:
+        loaded = wait_for_results_change(driver, current_items[0])
+    else:
+        loaded = wait_for_results(driver)
+    if not loaded or first_result_text(driver) == old_text:
+        print(f"✗ Page {page_num} did not load")
+        return False
+    
+    print(f"✓ Now on page {page_num}")
+    return True
+
+def open_detail_tab(driver):
+    """Open a second tab for detail pages so the results tab never has to reload
+
+    Returns (results_handle, detail_handle), or (None, None) if no tab could be opened.
+    The driver is left on the results tab.
+    """
+    try:
+        results_handle = driver.current_window_handle
+        driver.switch_to.new_window('tab')
+        detail_handle = driver.current_window_handle
+        if getattr(driver, "blocked_url_patterns", None):
+            block_resources(driver, driver.blocked_url_patterns)
+        driver.switch_to.window(results_handle)
+        print("✓ Opened a separate tab for detail pages")
+        return results_handle, detail_handle
+    except Exception as e:
+        print(f"⚠ Could not open detail tab, will navigate back to results instead: {e}")
+        return None, None
+
+def close_detail_tab(driver, results_handle, detail_handle):
+    """Close the detail tab and return to the results tab"""
+    try:
+        driver.switch_to.window(detail_handle)
+        driver.close()
+        driver.switch_to.window(results_handle)
+    except Exception as e:
+        print(f"⚠ Error closing detail tab: {e}")
+
+class BrowserRestartError(Exception):
+    """Raised when the browser could not be restarted; the crawl cannot continue"""
+
+class ManagedDriver:
+    """Chrome driver for the search results that survives long crawls
+
+    Behaves like the WebDriver it wraps (attribute access is forwarded).
+    The browser is replaced with a fresh one every RECYCLE_AFTER_PAGES
+    pages, when its processes use more than RECYCLE_RSS_MB (needs psutil),
+    or when its session died. After a replacement the search is set up
+    again (popup, business options, search) and the results are moved back
+    to the page being crawled; generation counts the replacements so
+    callers know when tab handles must be reopened and cookies copied again.
+    """
+
+    def __init__(self, url, headless=True, lean=None,
+                 recycle_pages=RECYCLE_AFTER_PAGES, rss_limit_mb=RECYCLE_RSS_MB):
+        self.url = url
+        self.headless = headless
+        self.lean = lean
+        self.recycle_pages = recycle_pages
+        self.rss_limit_mb = rss_limit_mb
+        self.pages = 0  # Pages crawled by the current browser
+        self.generation = 0
+        self.driver = create_driver(headless=headless, lean=lean)
+
+    def __getattr__(self, name):
+        # Only called for attributes ManagedDriver itself does not have
+        driver = self.__dict__.get("driver")
+        if driver is None:
+            raise AttributeError(name)
+        return getattr(driver, name)
+
+    def is_alive(self):
+        """Return True if the browser session still answers commands"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def quit(self):
+        """Quit the current browser, if there is one"""
+        driver, self.driver = self.driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def rss_mb(self):
+        """Return the memory used by chromedriver and its browser processes in MB, or None without psutil"""
+        if psutil is None:
+            return None
+        try:
+            process = psutil.Process(self.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            total = 0
+            for proc in processes:
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except Exception:
+            return None
+
+    def before_page(self, page_num):
+        """Call before crawling a results page; replaces the browser if it is dead or due for recycling
+
+        Returns True if the browser was replaced. Raises BrowserRestartError
+        if it had to be replaced and could not be.
+        """
+        reason = None
+        if not self.is_alive():
+            reason = "the browser session died"
+        elif self.recycle_pages and self.pages >= self.recycle_pages:
+            reason = f"{self.pages} pages crawled"
+        elif self.rss_limit_mb:
+            rss = self.rss_mb()
+            if rss and rss > self.rss_limit_mb:
+                reason = f"browser using {rss:.0f} MB"
+        
+        replaced = False
+        if reason:
+            print(f"\n♻️  Restarting the browser ({reason})...")
+            replaced = self.restart(page_num)
+        self.pages += 1
+        return replaced
+
+    def restart(self, page_num):
+        """Replace the browser and bring the search back to page_num
+
+        Returns True on success; raises BrowserRestartError after
+        MAX_DRIVER_RESTARTS failed attempts.
+        """
+        for attempt in range(1, MAX_DRIVER_RESTARTS + 1):
+            self.quit()
+            self.driver = create_driver(headless=self.headless, lean=self.lean)
+            self.generation += 1
+            self.pages = 0
+            if self.driver and self.establish_search(page_num):
+                print(f"✓ Browser restarted on page {page_num}")
+                return True
+            print(f"⚠ Browser restart {attempt}/{MAX_DRIVER_RESTARTS} failed")
+        self.quit()
+        raise BrowserRestartError(f"the browser could not be restarted on page {page_num}")
+
+    def establish_search(self, page_num):
+        """Run the search again in a fresh browser and go to page_num"""
+        try:
+            self.driver.get(self.url)
+            wait_for_page_ready(self.driver)
+            click_close_button(self.driver)
+            if not open_business_area_dropdown(self.driver):
+                return False
+            select_business_options(self.driver)
+            if not click_search_button(self.driver) or not wait_for_results(self.driver):
+                return False
+            if page_num <= 1 or seek_to_page(self.driver, page_num):
+                return True
+            # No chunckStart link: walk to the page instead
+            for _ in range(page_num - 1):
+                if not navigate_to_next_page(self.driver):
+                    return False
+            return True
+        except WebDriverException as e:
+            print(f"✗ Error setting up the search again: {e}")
+            return False
+
+def read_results_page(driver, page_num):
+    """Extract the cards of the current results page
+
+    A ManagedDriver is first recycled if due, and is restarted and asked
+    again if the page came back empty because its session died. Raises
+    BrowserRestartError if the browser could not be restarted.
+    """
+    if isinstance(driver, ManagedDriver):
+        driver.before_page(page_num)
+    lawyer_cards = extract_lawyer_cards(driver)
+    if not lawyer_cards and isinstance(driver, ManagedDriver) and not driver.is_alive():
+        driver.restart(page_num)
+        lawyer_cards = extract_lawyer_cards(driver)
+    return lawyer_cards
+
+def restart_crashed_browser(driver, page_num, error):
+    """Restart a ManagedDriver whose browser crashed while visiting detail pages
+
+    The caller reopens the detail tab afterwards. A plain WebDriver cannot be
+    restarted, so error is raised again; raises BrowserRestartError if the
+    browser could not be restarted.
+    """
+    if not isinstance(driver, ManagedDriver):
+        raise error
+    print(f"\n♻️  Restarting the browser (it crashed: {error.msg or type(error).__name__})...")
+    driver.restart(page_num)
+
+def go_to_next_page(driver, page_num):
+    """Move from page_num to the next results page, restarting a ManagedDriver whose session died
+
+    Raises BrowserRestartError if the browser could not be restarted.
+    """
+    if navigate_to_next_page(driver):
+        return True
+    if isinstance(driver, ManagedDriver) and not driver.is_alive():
+        driver.restart(page_num)
+        return navigate_to_next_page(driver)
+    return False
+
+def find_start_page(driver, start_number=START_FROM_LAWYER_NUMBER):
+    """Go to the results page holding lawyer #start_number
+
+    Seeks directly via chunckStart when possible, otherwise walks the pages
+    counting cards. Returns (target_page, lawyers_before_page) and leaves the
+    driver on that page.
+    """
+    target_page = 1
+    total_processed = 0
+    if start_number <= 0:
+        return target_page, total_processed
+    
+    # Fast path: compute the page from the lawyer number and jump straight to it
+    target_page = (start_number - 1) // RESULTS_PER_PAGE + 1
+    total_pages = get_total_pages(driver)
+    if total_pages and target_page > total_pages:
+        target_page = total_pages
+    if seek_to_page(driver, target_page):
+        total_processed = (target_page - 1) * RESULTS_PER_PAGE
+        print(f"   ✓ Lawyer #{start_number} is on page {target_page}")
+        return target_page, total_processed
+    target_page = 1
+    
+    print(f"\n🚀 Optimizing: Finding page with lawyer #{start_number}...")
+    print(f"   Going through pages and counting lawyers...")
+    
+    lawyers_counted = 0
+    search_page = 1
+    
+    while lawyers_counted < start_number:
+        # Extract lawyer cards from current page
+        lawyer_cards = extract_lawyer_cards(driver)
+        lawyers_on_page = len(lawyer_cards) if lawyer_cards else 0
+        
+        print(f"   Page {search_page}: {lawyers_on_page} lawyers (total counted: {lawyers_counted + lawyers_on_page})")
+        
+        # Check if target lawyer is on this page
+        if lawyers_counted + lawyers_on_page >= start_number:
+            # Target lawyer is on this page!
+            target_page = search_page
+            lawyers_to_skip_on_page = start_number - lawyers_counted - 1
+            total_processed = lawyers_counted
+            print(f"   ✓ Found! Lawyer #{start_number} is on page {target_page}")
+            print(f"   Will skip first {lawyers_to_skip_on_page} lawyers on this page")
+            break
+        
+        # Not on this page, move to next
+        lawyers_counted += lawyers_on_page
+        search_page += 1
+        
+        # Navigate to next page
+        if not navigate_to_next_page(driver):
+            print(f"   ⚠ Reached last page at {lawyers_counted} lawyers")
+            print(f"   Starting from lawyer #{lawyers_counted + 1} instead")
+            target_page = search_page - 1
+            total_processed = lawyers_counted
+            break
+    
+    return target_page, total_processed
+
+def print_lawyer_details(details):
+    """Print the extracted fields of a single lawyer"""
+    print(f"   ✓ Extracted: {details['name']}")
+    print(f"      תחום עיסוק: {details['area_of_practice'] or 'N/A'}")
+    print(f"      טלפון: {details['phone'] or 'N/A'}")
+    print(f"      מייל: {details['email'] or 'N/A'}")
+    print(f"      עיר: {details['city'] or 'N/A'}")
+
+def get_crawl_state():
+    """Return the process-wide crawl state store, opening it on first use"""
+    global _crawl_state
+    if _crawl_state is None:
+        _crawl_state = CrawlState()
+        print(f"📋 Crawl state: {_crawl_state.done_count()} lawyers already saved")
+    return _crawl_state
+
+def get_start_lawyer_number():
+    """Return the lawyer number to start from, resuming right after the last saved lawyer"""
+    start_number = START_FROM_LAWYER_NUMBER
+    progress = get_crawl_state().get_progress()
+    if progress and progress['lawyer_number'] + 1 > start_number:
+        start_number = progress['lawyer_number'] + 1
+        print(f"🔁 Resuming after lawyer #{progress['lawyer_number']} (page {progress['page']})")
+    # Go back for lawyers whose details could not be fetched; saved ones are skipped
+    first_failed = get_crawl_state().first_failed_number()
+    if first_failed and START_FROM_LAWYER_NUMBER <= first_failed < start_number:
+        start_number = first_failed
+        print(f"🔁 Retrying lawyers without details, starting from lawyer #{first_failed}")
+    return start_number
+
+def name_only_details(card):
+    """Return a details dict holding just the name from a result card"""
+    return {
+        "name": card['name'],
+        "area_of_practice": "",
+        "phone": "",
+        "email": "",
+        "city": ""
+    }
+
+def has_details(details):
+    """Return True if any detail field besides the name was extracted"""
+    return any(details.get(field) for field in ("area_of_practice", "phone", "email", "city"))
+
+def save_batch(details_list, page_num, filename="lawyer_names.txt"):
+    """Save a batch of lawyer details, starting a new file if none exists yet
+
+    Saved lawyers are recorded in the crawl state so a restart skips them.
+    Lawyers whose detail page gave nothing but a name are marked failed and
+    retried next run; lawyers without a detail page are done as they are.
+    """
+    print(f"\n💾 Saving batch of {len(details_list)} lawyers to file and Google Sheets...")
+    # The text file is written in the background, so the store tells whether
+    # earlier batches were saved
+    filepath = os.path.join(os.getcwd(), filename)
+    is_first_batch = get_store().is_empty() and (not os.path.exists(filepath) or os.path.getsize(filepath) == 0)
+    if not save_details_to_file(details_list, filename, append=not is_first_batch, page_num=page_num):
+        return
+    
+    crawl_state = get_crawl_state()
+    failed = [details for details in details_list if details.get('detail_url') and not has_details(details)]
+    crawl_state.mark([details for details in details_list if details not in failed], page_num)
+    if failed:
+        crawl_state.mark(failed, page_num, status=STATUS_FAILED)
+        print(f"⚠ {len(failed)} lawyers saved without details, will retry them on the next run")
+    lawyer_numbers = [details['lawyer_number'] for details in details_list if details.get('lawyer_number')]
+    if lawyer_numbers:
+        crawl_state.set_progress(page_num, max(lawyer_numbers), RESULTS_PER_PAGE)
+
+def record_details(all_details, details, card, page_num, lawyer_number):
+    """Add a lawyer's details to the crawl results, saving every 10 lawyers"""
+    if not details['name']:
+        details['name'] = card['name']
+    details['detail_url'] = card['detail_link']
+    details['lawyer_id'] = card.get('lawyer_id')
+    details['lawyer_number'] = lawyer_number
+    details['page'] = page_num
+    all_details.append(details)
+    print_lawyer_details(details)
+    
+    # Save to file and Google Sheets every 10 names
+    if len(all_details) % 10 == 0:
+        save_batch(all_details[-10:], page_num)
+
+def save_remaining(all_details, page_num):
+    """Save the last, partial batch of a crawl"""
+    remainder = len(all_details) % 10
+    if remainder:
+        save_batch(all_details[-remainder:], page_num)
+
+def extract_all_lawyer_details(driver, max_names=None, max_pages=None, resume_from_page=1, existing_count=0, detail_tab=True, use_http=True):
+    """Extract lawyer details from all pages by visiting each detail page
+
+    With detail_tab, detail pages are opened in a second tab so the results
+    page is loaded once per page instead of once per lawyer. With use_http,
+    detail pages are fetched over HTTP with the browser's cookies and the
+    browser is only used when that fails.
+    """
     print("\n" + "="*60)
     print("📚 Starting to extract lawyer details from all pages...")
     print("="*60)
     
-    # Start from lawyer #20,000
-    print(f"🎯 Starting from lawyer #{START_FROM_LAWYER_NUMBER}")
+    # Start from START_FROM_LAWYER_NUMBER, or right after the last saved lawyer
+    start_number = get_start_lawyer_number()
+    crawl_state = get_crawl_state()
+    print(f"🎯 Starting from lawyer #{start_number}")
     
     if max_names:
         remaining = max_names - existing_count
@@ -629,18 +1296,6 @@ def extract_all_lawyer_details(driver, max_names=None, max_pages=None, resume_fr
         print(f"📄 Maximum pages: {max_pages}")
     
     all_details = []
-    current_page = 1
-    original_url = driver.current_url
-    total_processed = 0  # Track total lawyers processed (including skipped ones)
-    
-    # Load existing names to avoid duplicates
-    existing_names = set()
-    try:
-        existing_lawyers = load_details_from_file("lawyer_names.txt")
-        existing_names = {lawyer.get('name', '').strip() for lawyer in existing_lawyers if lawyer.get('name')}
-        print(f"📋 Loaded {len(existing_names)} existing names to avoid duplicates")
-    except:
-        pass
     
     # Get total pages if possible
     total_pages = get_total_pages(driver)
@@ -648,132 +1303,139 @@ def extract_all_lawyer_details(driver, max_names=None, max_pages=None, resume_fr
         print(f"📄 Total pages available: {total_pages}")
     
     # Optimize: Go page by page, count lawyers until we reach the target number
-    target_page = 1
-    if START_FROM_LAWYER_NUMBER > 0:
-        print(f"\n🚀 Optimizing: Finding page with lawyer #{START_FROM_LAWYER_NUMBER}...")
-        print(f"   Going through pages and counting lawyers...")
-        
-        lawyers_counted = 0
-        search_page = 1
-        
-        while lawyers_counted < START_FROM_LAWYER_NUMBER:
-            # Extract lawyer cards from current page
-            lawyer_cards = extract_lawyer_cards(driver)
-            lawyers_on_page = len(lawyer_cards) if lawyer_cards else 0
+    # total_processed tracks total lawyers processed (including skipped ones)
+    target_page, total_processed = find_start_page(driver, start_number)
+    current_page = target_page
+    original_url = driver.current_url
+    
+    results_handle, detail_handle = open_detail_tab(driver) if detail_tab else (None, None)
+    tab_generation = getattr(driver, "generation", 0)
+    session = session_from_driver(driver) if use_http else None
+    
+    try:
+        while True:
+            print(f"\n{'='*60}")
+            print(f"📄 Page {current_page}")
+            print(f"{'='*60}")
             
-            print(f"   Page {search_page}: {lawyers_on_page} lawyers (total counted: {lawyers_counted + lawyers_on_page})")
+            # Extract lawyer cards (names and links) from current page
+            lawyer_cards = read_results_page(driver, current_page)
             
-            # Check if target lawyer is on this page
-            if lawyers_counted + lawyers_on_page >= START_FROM_LAWYER_NUMBER:
-                # Target lawyer is on this page!
-                target_page = search_page
-                lawyers_to_skip_on_page = START_FROM_LAWYER_NUMBER - lawyers_counted - 1
-                total_processed = lawyers_counted
-                print(f"   ✓ Found! Lawyer #{START_FROM_LAWYER_NUMBER} is on page {target_page}")
-                print(f"   Will skip first {lawyers_to_skip_on_page} lawyers on this page")
-                break
+            # A restarted browser has lost the detail tab
+            if getattr(driver, "generation", 0) != tab_generation:
+                results_handle, detail_handle = open_detail_tab(driver) if detail_tab else (None, None)
+                tab_generation = driver.generation
+                original_url = driver.current_url
             
-            # Not on this page, move to next
-            lawyers_counted += lawyers_on_page
-            search_page += 1
+            # Keep the HTTP session in step with the browser's search session
+            if session is not None:
+                sync_session_cookies(session, driver)
             
-            # Navigate to next page
-            if not navigate_to_next_page(driver):
-                print(f"   ⚠ Reached last page at {lawyers_counted} lawyers")
-                print(f"   Starting from lawyer #{lawyers_counted + 1} instead")
-                target_page = search_page - 1
-                total_processed = lawyers_counted
-                break
+            # Visit detail pages in the detail tab; the results tab stays on this page
+            if detail_handle:
+                try:
+                    driver.switch_to.window(detail_handle)
+                except WebDriverException as e:
+                    restart_crashed_browser(driver, current_page, e)
+                    results_handle, detail_handle = None, None
             
-            original_url = driver.current_url
-            time.sleep(2)
-        
-        current_page = target_page
-    
-    while True:
-        print(f"\n{'='*60}")
-        print(f"📄 Page {current_page}")
-        print(f"{'='*60}")
-        
-        # Extract lawyer cards (names and links) from current page
-        lawyer_cards = extract_lawyer_cards(driver)
-        
-        # Process each lawyer card
-        for i, card in enumerate(lawyer_cards, 1):
-            total_processed += 1
+            # Process each lawyer card
+            for i, card in enumerate(lawyer_cards, 1):
+                total_processed += 1
+                
+                # Skip until we reach target lawyer number
+                if total_processed < start_number:
+                    if total_processed % 100 == 0 or current_page == target_page:
+                        print(f"   ⏭️  Skipping lawyer #{total_processed} (need to reach #{start_number})")
+                    continue
+                
+                # Skip lawyers saved by an earlier run
+                if crawl_state.is_done(card['detail_link'], card['name']):
+                    print(f"   ⏭️  Skipping lawyer #{total_processed}: {card['name']} (already saved)")
+                    continue
+                
+                # Check if we've reached the limit
+                if max_names and len(all_details) >= max_names:
+                    print(f"\n✓ Reached target of {max_names} lawyers")
+                    break
+                
+                print(f"\n   [{len(all_details) + 1}/{max_names if max_names else '?'}] Processing lawyer #{total_processed}: {card['name']}")
+                
+                # A browser restarted after a crash on this page has lost the detail tab
+                if getattr(driver, "generation", 0) != tab_generation:
+                    results_handle, detail_handle = open_detail_tab(driver) if detail_tab else (None, None)
+                    tab_generation = driver.generation
+                    original_url = driver.current_url
+                    if session is not None:
+                        sync_session_cookies(session, driver)
+                    if detail_handle:
+                        driver.switch_to.window(detail_handle)
+                
+                # If we have a detail link, visit it
+                if card['detail_link']:
+                    print(f"   🔗 Opening detail page...")
+                    try:
+                        details = get_lawyer_details(driver, card['detail_link'], session, None if detail_handle else original_url)
+                        # extract_lawyer_details reports a crashed browser as an empty page
+                        if not has_details(details) and isinstance(driver, ManagedDriver) and not driver.is_alive():
+                            raise WebDriverException("the browser session died")
+                    except WebDriverException as e:
+                        restart_crashed_browser(driver, current_page, e)
+                        results_handle, detail_handle = None, None
+                        details = name_only_details(card)
+                else:
+                    # No detail link, just save the name
+                    print(f"   ⚠ No detail link found, saving name only")
+                    details = name_only_details(card)
+                
+                # Name from the card is used if the detail page doesn't have it
+                record_details(all_details, details, card, current_page, total_processed)
             
-            # Skip until we reach target lawyer number
-            if total_processed < START_FROM_LAWYER_NUMBER:
-                if total_processed % 100 == 0 or (START_FROM_LAWYER_NUMBER > 0 and current_page == target_page and total_processed < START_FROM_LAWYER_NUMBER):
-                    print(f"   ⏭️  Skipping lawyer #{total_processed} (need to reach #{START_FROM_LAWYER_NUMBER})")
-                continue
+            if detail_handle:
+                try:
+                    driver.switch_to.window(results_handle)
+                except WebDriverException as e:
+                    restart_crashed_browser(driver, current_page, e)
+                    results_handle, detail_handle = None, None
+            
+            print(f"\n📊 Total details collected so far: {len(all_details)}")
             
-            # Check if we've reached the limit
+            # Check if we've reached the name limit
             if max_names and len(all_details) >= max_names:
                 print(f"\n✓ Reached target of {max_names} lawyers")
                 break
             
-            print(f"\n   [{len(all_details) + 1}/{max_names if max_names else '?'}] Processing lawyer #{total_processed}: {card['name']}")
+            # Check if we should continue (page limit)
+            if max_pages and current_page >= max_pages:
+                print(f"\n✓ Reached maximum page limit ({max_pages})")
+                break
             
-            # If we have a detail link, visit it
-            if card['detail_link']:
-                print(f"   🔗 Opening detail page...")
-                details = extract_lawyer_details(driver, card['detail_link'], original_url)
-                
-                # Use name from card if detail page doesn't have it
-                if not details['name']:
-                    details['name'] = card['name']
-                
-                all_details.append(details)
-                print(f"   ✓ Extracted: {details['name']}")
-                print(f"      תחום עיסוק: {details['area_of_practice'] or 'N/A'}")
-                print(f"      טלפון: {details['phone'] or 'N/A'}")
-                print(f"      מייל: {details['email'] or 'N/A'}")
-                print(f"      עיר: {details['city'] or 'N/A'}")
-            else:
-                # No detail link, just save the name
-                details = {
-                    "name": card['name'],
-                    "area_of_practice": "",
-                    "phone": "",
-                    "email": "",
-                    "city": ""
-                }
-                all_details.append(details)
-                print(f"   ⚠ No detail link found, saved name only")
+            # Try to navigate to next page
+            if not go_to_next_page(driver, current_page):
+                print("\n✓ Reached the last page")
+                break
             
-            # Save to file and Google Sheets every 10 names (for both cases)
-            if len(all_details) % 10 == 0:
-                print(f"\n💾 Saving batch of 10 lawyers to file and Google Sheets...")
-                filepath = os.path.join(os.getcwd(), "lawyer_names.txt")
-                is_first_batch = not os.path.exists(filepath) or os.path.getsize(filepath) == 0
-                save_details_to_file(all_details[-10:], append=not is_first_batch, page_num=current_page)
-        
-        print(f"\n📊 Total details collected so far: {len(all_details)}")
-        
-        # Check if we've reached the name limit
-        if max_names and len(all_details) >= max_names:
-            print(f"\n✓ Reached target of {max_names} lawyers")
-            break
-        
-        # Check if we should continue (page limit)
-        if max_pages and current_page >= max_pages:
-            print(f"\n✓ Reached maximum page limit ({max_pages})")
-            break
-        
-        # Try to navigate to next page
-        if not navigate_to_next_page(driver):
-            print("\n✓ Reached the last page")
-            break
-        
-        # Update original_url for next page
-        original_url = driver.current_url
-        current_page += 1
-        
-        # Safety limit
-        if current_page > 1000:
-            print("\n⚠ Safety limit reached (1000 pages)")
-            break
+            # Update original_url for next page
+            original_url = driver.current_url
+            current_page += 1
+            
+            # Safety limit
+            if current_page > 1000:
+                print("\n⚠ Safety limit reached (1000 pages)")
+                break
+    except (BrowserRestartError, WebDriverException):
+        # Save what was collected before the browser was lost, then stop the crawl
+        if session is not None:
+            session.close()
+        save_remaining(all_details, current_page)
+        raise
+    
+    if detail_handle:
+        close_detail_tab(driver, results_handle, detail_handle)
+    if session is not None:
+        session.close()
+    
+    save_remaining(all_details, current_page)
     
     # Trim to exact limit if needed
     if max_names and len(all_details) > max_names:
@@ -782,164 +1444,331 @@ def extract_all_lawyer_details(driver, max_names=None, max_pages=None, resume_fr
     
     return all_details
 
-def save_details_to_excel(details_list, filename="lawyer_names.xlsx", append=False, page_num=None):
-    """Save extracted lawyer details to an Excel file"""
+def detail_worker(driver, task_queue, results, results_ready, session=None):
+    """Worker loop: fetch detail pages from the queue on its own driver"""
+    while True:
+        task = task_queue.get()
+        try:
+            if task is None:
+                return
+            seq, card = task
+            details = get_lawyer_details(driver, card['detail_link'], session)
+            with results_ready:
+                results[seq] = details
+                results_ready.notify_all()
+        finally:
+            task_queue.task_done()
+
+def extract_all_lawyer_details_parallel(driver, workers=DETAIL_WORKERS, max_names=None, max_pages=None, headless=True, use_http=True):
+    """Extract lawyer details using a pool of Chrome drivers
+
+    The given driver walks the result pages and queues detail links; each
+    worker driver fetches and parses detail pages concurrently. Results are
+    saved in page/position order, exactly like the sequential extractor.
+    """
+    print("\n" + "="*60)
+    print(f"📚 Starting parallel extraction with {workers} detail workers...")
+    print("="*60)
+    
+    worker_drivers = []
+    for _ in range(workers):
+        worker_driver = create_driver(headless=headless)
+        if worker_driver:
+            worker_drivers.append(worker_driver)
+    
+    if not worker_drivers:
+        print("⚠ Could not start any worker drivers, falling back to sequential extraction")
+        return extract_all_lawyer_details(driver, max_names=max_names, max_pages=max_pages, use_http=use_http)
+    
+    print(f"✓ Started {len(worker_drivers)} worker drivers")
+    
+    # Bounded queue keeps the result-page walker from running far ahead of the workers
+    task_queue = queue.Queue(maxsize=len(worker_drivers) * 20)
+    results = {}
+    results_ready = threading.Condition()
+    threads = []
+    sessions = []
+    for worker_driver in worker_drivers:
+        # Each worker gets its own HTTP session carrying the search session's cookies
+        session = session_from_driver(driver) if use_http else None
+        if session is not None:
+            sessions.append(session)
+        thread = threading.Thread(target=detail_worker, args=(worker_driver, task_queue, results, results_ready, session), daemon=True)
+        thread.start()
+        threads.append(thread)
+    
+    all_details = []
+    slots = []  # (page_num, lawyer_number, card) for every lawyer to save, in crawl order
+    next_seq = 0
+    start_number = get_start_lawyer_number()
+    crawl_state = get_crawl_state()
+    
+    def collect(wait=False):
+        """Move finished results into all_details in order, saving every 10"""
+        nonlocal next_seq
+        while next_seq < len(slots):
+            page_num, lawyer_number, card = slots[next_seq]
+            if card['detail_link']:
+                with results_ready:
+                    while wait and next_seq not in results:
+                        results_ready.wait()
+                    if next_seq not in results:
+                        return
+                    details = results.pop(next_seq)
+            else:
+                details = name_only_details(card)
+            record_details(all_details, details, card, page_num, lawyer_number)
+            next_seq += 1
+    
     try:
-        filepath = os.path.join(os.getcwd(), filename)
-        
-        # Headers in Hebrew
-        headers = ["שם", "התמחות", "טלפון", "מייל", "עיר", "דף"]
+        target_page, total_processed = find_start_page(driver, start_number)
+        current_page = target_page
+        session_generation = getattr(driver, "generation", 0)
         
-        if append and os.path.exists(filepath):
-            # Load existing workbook
-            wb = load_workbook(filepath)
-            ws = wb.active
-        else:
-            # Create new workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Lawyers"
+        while True:
+            print(f"\n{'='*60}")
+            print(f"📄 Page {current_page}")
+            print(f"{'='*60}")
             
-            # Write headers
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num)
-                cell.value = header
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal='center')
-        
-        # Find the next empty row
-        next_row = ws.max_row + 1 if append and os.path.exists(filepath) else 2
-        
-        # Write data
-        for details in details_list:
-            ws.cell(row=next_row, column=1, value=details.get('name', ''))
-            ws.cell(row=next_row, column=2, value=details.get('area_of_practice', ''))
-            ws.cell(row=next_row, column=3, value=details.get('phone', ''))
-            ws.cell(row=next_row, column=4, value=details.get('email', ''))
-            ws.cell(row=next_row, column=5, value=details.get('city', ''))
-            ws.cell(row=next_row, column=6, value=page_num if page_num else '')
-            next_row += 1
-        
-        # Auto-adjust column widths
-        for col in ws.columns:
-            max_length = 0
-            col_letter = col[0].column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[col_letter].width = adjusted_width
-        
-        wb.save(filepath)
+            lawyer_cards = read_results_page(driver, current_page)
+            if getattr(driver, "generation", 0) != session_generation:
+                # A restarted browser has a new search session; the workers need its cookies
+                for session in sessions:
+                    sync_session_cookies(session, driver)
+                session_generation = driver.generation
+            for card in lawyer_cards:
+                total_processed += 1
+                if total_processed < start_number or crawl_state.is_done(card['detail_link'], card['name']):
+                    continue
+                if max_names and len(slots) >= max_names:
+                    break
+                seq = len(slots)
+                slots.append((current_page, total_processed, card))
+                if card['detail_link']:
+                    task_queue.put((seq, card))
+            
+            # Save whatever has finished so far without blocking the walker
+            collect()
+            print(f"\n📊 Queued {len(slots)} lawyers, saved {len(all_details)} so far")
+            
+            if max_names and len(slots) >= max_names:
+                print(f"\n✓ Reached target of {max_names} lawyers")
+                break
+            if max_pages and current_page >= max_pages:
+                print(f"\n✓ Reached maximum page limit ({max_pages})")
+                break
+            if not go_to_next_page(driver, current_page):
+                print("\n✓ Reached the last page")
+                break
+            
+            current_page += 1
+            if current_page > 1000:
+                print("\n⚠ Safety limit reached (1000 pages)")
+                break
         
-        action = "Appended" if append else "Saved"
-        page_info = f" (page {page_num})" if page_num else ""
-        print(f"✓ {action} {len(details_list)} lawyer details{page_info} to Excel: {filepath}")
-        return filepath
-    except Exception as e:
-        print(f"✗ Error saving details to Excel: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+        # Wait for the workers to drain the queue, then save the rest in order
+        collect(wait=True)
+        if slots:
+            save_remaining(all_details, slots[-1][0])
+        return all_details
+    except BrowserRestartError:
+        # Save what was queued before the browser was lost, then stop the crawl
+        collect(wait=True)
+        if slots:
+            save_remaining(all_details, slots[-1][0])
+        raise
+    finally:
+        for _ in threads:
+            task_queue.put(None)
+        for thread in threads:
+            thread.join(timeout=30)
+        for worker_driver in worker_drivers:
+            try:
+                worker_driver.quit()
+            except:
+                pass
+        for session in sessions:
+            session.close()
 
-def save_details_to_google_sheets(details_list, sheet_id=GOOGLE_SHEETS_ID):
-    """Save extracted lawyer details to Google Sheets"""
-    global _google_sheets_warning_shown
+def extract_all_lawyer_details_async(driver, concurrency=ASYNC_CONCURRENCY, rate=ASYNC_RATE_LIMIT, max_names=None, max_pages=None):
+    """Extract lawyer details with the asyncio crawler
+
+    The driver walks the result pages; all detail pages of a page are fetched
+    concurrently over HTTP, at most `rate` requests per second per host.
+    Pages that fail over HTTP are loaded in a second browser tab instead.
+    """
+    print("\n" + "="*60)
+    print(f"📚 Starting async extraction ({concurrency} concurrent, {rate} req/s)...")
+    print("="*60)
+    
+    all_details = []
+    start_number = get_start_lawyer_number()
+    crawl_state = get_crawl_state()
+    target_page, total_processed = find_start_page(driver, start_number)
+    current_page = target_page
+    
+    crawler = AsyncDetailCrawler(concurrency=concurrency, rate=rate, cookies=driver_cookies(driver))
+    results_handle, detail_handle = None, None
+    tab_generation = getattr(driver, "generation", 0)
+    
     try:
-        # Try to authenticate with Google Sheets
-        # First, try to use service account credentials from a JSON file
-        creds_file = os.path.join(os.getcwd(), "credentials.json")
-        
-        if not os.path.exists(creds_file):
-            if not _google_sheets_warning_shown:
-                print("⚠ Google Sheets credentials.json not found. Skipping Google Sheets update.")
-                print("   To enable Google Sheets, create a service account and save credentials.json")
-                _google_sheets_warning_shown = True
-            return False
-        
-        # Authenticate
-        scope = ['https://spreadsheets.google.com/feeds',
-                 'https://www.googleapis.com/auth/drive']
-        creds = Credentials.from_service_account_file(creds_file, scopes=scope)
-        client = gspread.authorize(creds)
-        
-        # Open the spreadsheet
-        sheet = client.open_by_key(sheet_id)
-        worksheet = sheet.sheet1
-        
-        # Get existing data to find next row
-        try:
-            existing_data = worksheet.get_all_values()
-            next_row = len(existing_data) + 1
-        except:
-            next_row = 1
-        
-        # If first time, add headers
-        if next_row == 1:
-            headers = [["שם", "התמחות", "טלפון", "מייל", "עיר"]]
-            worksheet.append_rows(headers)
-            next_row = 2
-        
-        # Prepare data rows
-        rows_to_add = []
-        for details in details_list:
-            row = [
-                details.get('name', ''),
-                details.get('area_of_practice', ''),
-                details.get('phone', ''),
-                details.get('email', ''),
-                details.get('city', '')
-            ]
-            rows_to_add.append(row)
-        
-        # Append rows to Google Sheets
-        if rows_to_add:
-            worksheet.append_rows(rows_to_add)
-            print(f"✓ Saved {len(rows_to_add)} lawyers to Google Sheets")
-            return True
-        
-        return False
+        while True:
+            print(f"\n{'='*60}")
+            print(f"📄 Page {current_page}")
+            print(f"{'='*60}")
+            
+            lawyer_cards = read_results_page(driver, current_page)
+            if getattr(driver, "generation", 0) != tab_generation:
+                # A restarted browser has lost the detail tab; it is reopened when needed
+                results_handle, detail_handle = None, None
+                tab_generation = driver.generation
+            page_cards = []  # (lawyer_number, card)
+            for card in lawyer_cards:
+                total_processed += 1
+                if total_processed < start_number or crawl_state.is_done(card['detail_link'], card['name']):
+                    continue
+                if max_names and len(all_details) + len(page_cards) >= max_names:
+                    break
+                page_cards.append((total_processed, card))
+            
+            crawler.update_cookies(driver_cookies(driver))
+            links = [card['detail_link'] for _, card in page_cards if card['detail_link']]
+            fetched = iter(crawler.fetch_all(links))
+            
+            for lawyer_number, card in page_cards:
+                details = next(fetched) if card['detail_link'] else None
+                if card['detail_link'] and not details:
+                    # Fall back to the browser for pages the HTTP path could not read
+                    if detail_handle is None:
+                        results_handle, detail_handle = open_detail_tab(driver)
+                    if detail_handle:
+                        try:
+                            driver.switch_to.window(detail_handle)
+                            details = extract_lawyer_details(driver, card['detail_link'])
+                            driver.switch_to.window(results_handle)
+                            if not has_details(details) and isinstance(driver, ManagedDriver) and not driver.is_alive():
+                                raise WebDriverException("the browser session died")
+                        except WebDriverException as e:
+                            # The detail tab is reopened for the next fallback
+                            restart_crashed_browser(driver, current_page, e)
+                            results_handle, detail_handle = None, None
+                            tab_generation = driver.generation
+                            details = None
+                if not details:
+                    details = name_only_details(card)
+                record_details(all_details, details, card, current_page, lawyer_number)
+            
+            print(f"\n📊 Total details collected so far: {len(all_details)}")
+            
+            if max_names and len(all_details) >= max_names:
+                print(f"\n✓ Reached target of {max_names} lawyers")
+                break
+            if max_pages and current_page >= max_pages:
+                print(f"\n✓ Reached maximum page limit ({max_pages})")
+                break
+            if not go_to_next_page(driver, current_page):
+                print("\n✓ Reached the last page")
+                break
+            
+            current_page += 1
+            if current_page > 1000:
+                print("\n⚠ Safety limit reached (1000 pages)")
+                break
         
-    except Exception as e:
-        print(f"⚠ Error saving to Google Sheets: {e}")
-        print("   Continuing with local file save...")
+        save_remaining(all_details, current_page)
+        return all_details
+    except (BrowserRestartError, WebDriverException):
+        # Save what was collected before the browser was lost, then stop the crawl
+        results_handle, detail_handle = None, None
+        save_remaining(all_details, current_page)
+        raise
+    finally:
+        crawler.close()
+        if detail_handle:
+            close_detail_tab(driver, results_handle, detail_handle)
+
+def get_sheets_sink(sheet_id=GOOGLE_SHEETS_ID):
+    """Return the process-wide Google Sheets sink for a sheet, creating it on first use"""
+    with _sheets_sinks_lock:
+        if sheet_id not in _sheets_sinks:
+            sink = GoogleSheetsSink(sheet_id)
+            _sheets_sinks[sheet_id] = sink
+            atexit.register(sink.close)
+        return _sheets_sinks[sheet_id]
+
+def save_details_to_google_sheets(details_list, sheet_id=GOOGLE_SHEETS_ID, flush=False):
+    """Save extracted lawyer details to Google Sheets
+
+    Rows are buffered and sent in larger append_rows batches; pass flush=True
+    to send them immediately. Buffered rows are also sent at exit.
+    """
+    sink = get_sheets_sink(sheet_id)
+    if not sink.add(details_list):
         return False
+    return sink.flush() if flush else True
+
+def flush_google_sheets():
+    """Send the rows still buffered for Google Sheets"""
+    with _sheets_sinks_lock:
+        sinks = list(_sheets_sinks.values())
+    for sink in sinks:
+        sink.flush()
+
+def get_persistence(filename="lawyer_names.txt"):
+    """Return the background export pipeline (text file, Excel, Google Sheets) for a text file"""
+    with _pipelines_lock:
+        if filename not in _pipelines:
+            pipeline = PersistencePipeline([
+                TextFileSink(filename),
+                ExcelSink(get_store(), filename.replace(".txt", ".xlsx")),
+                get_sheets_sink()
+            ])
+            _pipelines[filename] = pipeline
+            atexit.register(pipeline.close)
+        return _pipelines[filename]
+
+def close_persistence():
+    """Wait until every queued export is written, then stop the export workers"""
+    with _pipelines_lock:
+        pipelines = list(_pipelines.values())
+        _pipelines.clear()
+    if pipelines:
+        print("\n💾 Finishing exports to file, Excel and Google Sheets...")
+    for pipeline in pipelines:
+        pipeline.close()
+    flush_google_sheets()
 
 def save_details_to_file(details_list, filename="lawyer_names.txt", append=False, page_num=None):
-    """Save extracted lawyer details to a text file and Excel file in the specified format"""
+    """Save extracted lawyer details to the lawyer store
+
+    The text file, Excel file and Google Sheet are kept in step as exports,
+    written in the background by the persistence pipeline.
+    Saving with append=False starts the store over, like the text file.
+    Appending to an empty store first loads the lawyers already in the
+    text file, so the store (and the exports regenerated from it) keeps them.
+    """
     try:
-        # Save to text file
-        filepath = os.path.join(os.getcwd(), filename)
-        mode = "a" if append else "w"
-        
-        with open(filepath, mode, encoding="utf-8") as f:
-            # Write page header if provided
-            if page_num is not None:
-                f.write(f"page{page_num}:\n")
-            
-            for details in details_list:
-                f.write(f"שם: {details.get('name', '')}\n")
-                f.write(f"התמכות: {details.get('area_of_practice', '')}\n")
-                f.write(f"טלפון: {details.get('phone', '')}\n")
-                f.write(f"מייל: {details.get('email', '')}\n")
-                f.write(f"עיר: {details.get('city', '')}\n")
-                f.write("\n")  # Empty line between entries
+        # Save to the primary store; the crawl state relies on this being durable
+        store = get_store()
+        if not append:
+            store.clear()
+        elif store.is_empty():
+            filepath = os.path.join(os.getcwd(), filename)
+            if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+                imported = store.import_text_file(filename)
+                print(f"✓ Loaded {imported} existing lawyers from {filename} into the store")
+        new_details = store.add_lawyers(details_list, page_num)
+        
+        # Queue for the text file, Excel and Google Sheets; retried lawyers
+        # were already exported and are only updated in the store
+        if new_details:
+            get_persistence(filename).submit(new_details, page_num, append)
         
         action = "Appended" if append else "Saved"
         page_info = f" (page {page_num})" if page_num else ""
-        print(f"\n✓ {action} {len(details_list)} lawyer details{page_info} to: {filepath}")
-        
-        # Also save to Excel
-        excel_filename = filename.replace(".txt", ".xlsx")
-        save_details_to_excel(details_list, excel_filename, append=append, page_num=page_num)
+        print(f"\n✓ {action} {len(details_list)} lawyer details{page_info} to: {store.filepath}")
         
-        # Also save to Google Sheets
-        save_details_to_google_sheets(details_list)
-        
-        return filepath
+        return os.path.join(os.getcwd(), filename)
     except Exception as e:
         print(f"✗ Error saving details to file: {e}")
         import traceback
@@ -948,81 +1777,18 @@ def save_details_to_file(details_list, filename="lawyer_names.txt", append=False
 
 def get_last_page_from_file(filename="lawyer_names.txt"):
     """Get the last page number from the file"""
-    try:
-        filepath = os.path.join(os.getcwd(), filename)
-        if not os.path.exists(filepath):
-            return 0
-        
-        last_page = 0
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("page") and ":" in line:
-                    try:
-                        page_num = int(line.split("page")[1].split(":")[0])
-                        last_page = max(last_page, page_num)
-                    except:
-                        pass
-        
-        return last_page
-    except:
-        return 0
+    _, _, last_page = scan_lawyer_file(filename)
+    return last_page
 
 def count_lawyers_in_file(filename="lawyer_names.txt"):
     """Count how many lawyers are already in the file"""
-    try:
-        filepath = os.path.join(os.getcwd(), filename)
-        if not os.path.exists(filepath):
-            return 0
-        
-        count = 0
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("שם:"):
-                    count += 1
-        
-        return count
-    except:
-        return 0
+    _, count, _ = scan_lawyer_file(filename)
+    return count
 
 def load_details_from_file(filename="lawyer_names.txt"):
     """Load lawyer details from file and return as list"""
-    try:
-        filepath = os.path.join(os.getcwd(), filename)
-        if not os.path.exists(filepath):
-            return []
-        
-        details_list = []
-        current_detail = {}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("שם:"):
-                    if current_detail:  # Save previous detail
-                        details_list.append(current_detail)
-                    current_detail = {"name": line.replace("שם:", "").strip()}
-                elif line.startswith("התמכות:"):
-                    current_detail["area_of_practice"] = line.replace("התמכות:", "").strip()
-                elif line.startswith("טלפון:"):
-                    current_detail["phone"] = line.replace("טלפון:", "").strip()
-                elif line.startswith("מייל:"):
-                    current_detail["email"] = line.replace("מייל:", "").strip()
-                elif line.startswith("עיר:"):
-                    current_detail["city"] = line.replace("עיר:", "").strip()
-                elif line == "" and current_detail:
-                    # Empty line indicates end of entry
-                    if current_detail:
-                        details_list.append(current_detail)
-                        current_detail = {}
-            
-            # Add last detail if exists
-            if current_detail:
-                details_list.append(current_detail)
-        
-        return details_list
-    except Exception as e:
-        print(f"✗ Error loading details from file: {e}")
-        return []
+    records, _, _ = scan_lawyer_file(filename)
+    return [details for _, details in records]
 
 def click_print_and_download_pdf(driver, download_dir=None):
     """Click the print button and download the PDF"""
@@ -1234,11 +2000,25 @@ def find_and_click_links(driver, max_links=5):
     print(f"\n✓ Successfully clicked {clicked_count} elements")
     return clicked_count
 
-def interactive_scraper(url, headless=True):
-    """Main scraper function that opens browser and shows interactions"""
-    driver = create_driver(headless=headless)
+def interactive_scraper(url, headless=True, workers=1, use_http=True, mode=None, fast_mode=None):
+    """Main scraper function that opens browser and shows interactions
+
+    mode selects how detail pages are fetched:
+      "sequential" - one at a time on the search driver
+      "pool"       - by a pool of `workers` drivers (the default when workers > 1)
+      "async"      - by the asyncio crawler, rate limited per host
+    With use_http, the sequential and pool modes fetch detail pages over HTTP
+    and only fall back to the browser.
+    fast_mode skips the visual click feedback; it defaults to on when headless.
+    """
+    if mode is None:
+        mode = "pool" if workers > 1 else "sequential"
+    set_fast_mode(headless if fast_mode is None else fast_mode)
+    
+    # Recycled every RECYCLE_AFTER_PAGES pages and restarted if Chrome dies mid-crawl
+    driver = ManagedDriver(url, headless=headless)
     
-    if not driver:
+    if not driver.driver:
         return None
     
     try:
@@ -1249,11 +2029,9 @@ def interactive_scraper(url, headless=True):
         
         # Navigate to URL
         driver.get(url)
+        wait_for_page_ready(driver)
         print("✓ Page loaded")
         
-        # Wait for page to load
-        time.sleep(3)
-        
         # Get page info
         print("\n" + "="*60)
         print("📄 Page Information")
@@ -1269,9 +2047,6 @@ def interactive_scraper(url, headless=True):
         # Click the close button first (if it exists)
         click_close_button(driver)
         
-        # Wait a bit after closing
-        time.sleep(1)
-        
         # Open business area dropdown
         if open_business_area_dropdown(driver):
             # Select business options
@@ -1284,16 +2059,18 @@ def interactive_scraper(url, headless=True):
             
             # Click search button
             if click_search_button(driver):
-                # Wait for search results to load
-                time.sleep(3)
-                
                 # Extract all lawyer details (visiting each detail page)
                 # Starting from lawyer #20,000
-                print(f"\n📊 Starting from lawyer #{START_FROM_LAWYER_NUMBER}")
+                print(f"\n📊 Starting from lawyer #{START_FROM_LAWYER_NUMBER} (or where the last run stopped)")
                 
                 # Note: Details are saved every 10 names automatically
                 # No limit - will scrape all available lawyers
-                all_details = extract_all_lawyer_details(driver, max_names=None, resume_from_page=1, existing_count=0)
+                if mode == "async":
+                    all_details = extract_all_lawyer_details_async(driver, max_names=None)
+                elif mode == "pool":
+                    all_details = extract_all_lawyer_details_parallel(driver, workers=workers, max_names=None, headless=headless, use_http=use_http)
+                else:
+                    all_details = extract_all_lawyer_details(driver, max_names=None, resume_from_page=1, existing_count=0, use_http=use_http)
                 
                 # Final verification
                 if all_details:
@@ -1325,12 +2102,17 @@ def interactive_scraper(url, headless=True):
         
         return driver.page_source
         
+    except BrowserRestartError as e:
+        print(f"\n✗ Stopping the crawl: {e}")
+        print("   Run the scraper again to resume where it stopped")
+        return None
     except Exception as e:
         print(f"\n✗ Error: {str(e)}")
         import traceback
         traceback.print_exc()
         return None
     finally:
+        close_persistence()
         print("\nClosing browser...")
         driver.quit()
 
@@ -1349,7 +2131,8 @@ if __name__ == "__main__":
     print("\n" + "="*60 + "\n")
     
     # Run in headless mode (set to False if you want to see the browser)
-    html_content = interactive_scraper(url, headless=True)
+    # Detail pages are fetched by DETAIL_WORKERS drivers in parallel (set workers=1 for a single driver)
+    html_content = interactive_scraper(url, headless=True, workers=DETAIL_WORKERS)
     
     if html_content:
         print("\n✓ Scraping completed successfully!")
@@ -0,0 +1,127 @@
+"""
+Durable crawl state for the scraper: which lawyers were already saved and
+where the crawl stopped, so a restart resumes at the exact card.
+Stored in SQLite (WAL mode) next to lawyer_names.txt.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+CRAWL_STATE_DB = "crawl_state.db"
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+def card_key(detail_url, name):
+    """Return the state key of a lawyer: its detail URL, or its name when there is no link"""
+    return detail_url if detail_url else f"name:{name}"
+
+class CrawlState:
+    """Visited lawyers, per-lawyer status and the current crawl position
+
+    Saved keys are also kept in memory so lookups during the crawl are O(1).
+    """
+
+    def __init__(self, filename=CRAWL_STATE_DB):
+        self.filepath = os.path.join(os.getcwd(), filename)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS lawyers (
+                key TEXT PRIMARY KEY,
+                name TEXT,
+                page INTEGER,
+                lawyer_number INTEGER,
+                status TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS progress (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                page INTEGER NOT NULL,
+                chunck_start INTEGER NOT NULL,
+                lawyer_number INTEGER NOT NULL,
+                updated_at REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+        self._done = {
+            row[0] for row in self._conn.execute("SELECT key FROM lawyers WHERE status = ?", (STATUS_DONE,))
+        }
+
+    def is_done(self, detail_url, name=""):
+        """Return True if this lawyer was already saved"""
+        return card_key(detail_url, name) in self._done
+
+    def done_count(self):
+        """Return how many lawyers were saved"""
+        return len(self._done)
+
+    def first_failed_number(self):
+        """Return the lowest lawyer number whose details could not be fetched, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(lawyer_number) FROM lawyers WHERE status = ?", (STATUS_FAILED,)
+            ).fetchone()
+        return row[0]
+
+    def mark(self, details_list, page_num, status=STATUS_DONE):
+        """Record the status of a batch of lawyers in a single transaction"""
+        now = time.time()
+        rows = []
+        for details in details_list:
+            key = card_key(details.get('detail_url'), details.get('name', ''))
+            rows.append((key, details.get('name', ''), page_num, details.get('lawyer_number'), status, now))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO lawyers (key, name, page, lawyer_number, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET page = excluded.page, lawyer_number = excluded.lawyer_number, "
+                "status = excluded.status, updated_at = excluded.updated_at",
+                rows
+            )
+            self._conn.commit()
+            for row in rows:
+                if status == STATUS_DONE:
+                    self._done.add(row[0])
+                else:
+                    self._done.discard(row[0])
+
+    def set_progress(self, page_num, lawyer_number, results_per_page):
+        """Remember the page and lawyer number the crawl has saved up to
+
+        The position never moves backwards, so retrying failed lawyers does
+        not make the next run walk pages that were already saved.
+        """
+        chunck_start = (page_num - 1) * results_per_page
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO progress (id, page, chunck_start, lawyer_number, updated_at) VALUES (1, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET page = excluded.page, chunck_start = excluded.chunck_start, "
+                "lawyer_number = excluded.lawyer_number, updated_at = excluded.updated_at "
+                "WHERE excluded.lawyer_number > progress.lawyer_number",
+                (page_num, chunck_start, lawyer_number, time.time())
+            )
+            self._conn.commit()
+
+    def get_progress(self):
+        """Return the saved crawl position as a dict, or None if nothing was saved yet"""
+        with self._lock:
+            row = self._conn.execute("SELECT page, chunck_start, lawyer_number FROM progress WHERE id = 1").fetchone()
+        if not row:
+            return None
+        return {"page": row[0], "chunck_start": row[1], "lawyer_number": row[2]}
+
+    def reset(self):
+        """Forget all visited lawyers and the crawl position"""
+        with self._lock:
+            self._conn.execute("DELETE FROM lawyers")
+            self._conn.execute("DELETE FROM progress")
+            self._conn.commit()
+            self._done.clear()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
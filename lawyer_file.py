@@ -0,0 +1,213 @@
+"""
+Reader and writer for lawyer_names.txt.
+LawyerRecordParser is the one parser of the format; everything that reads
+the file goes through it. The incremental reader remembers how far the file
+was parsed so each call only parses the bytes appended since, and notices
+when the file was truncated or rewritten. render_lawyers() builds the text
+for a batch.
+"""
+import os
+import threading
+
+HEAD_CHECK_BYTES = 64  # Bytes compared at the start and at the parsed offset to detect a rewritten file
+
+# Line label (the text before the first ':') -> field
+FIELD_LABELS = {
+    "שם": "name",
+    "התמכות": "area_of_practice",
+    "טלפון": "phone",
+    "מייל": "email",
+    "עיר": "city",
+}
+
+_scan_cache = {}  # filepath -> (file signature, records, count, last_page)
+_scan_cache_lock = threading.Lock()
+
+class LawyerRecordParser:
+    """Line-by-line parser turning lawyer_names.txt lines into (page, details) records
+
+    Each line is split once at its first ':' and the label is looked up in
+    FIELD_LABELS. A record is complete once its city line (the last field),
+    the blank line after it, the next name or a page header has been read.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.current = {}
+        self.page = None
+        self.last_page = 0
+        self.count = 0
+
+    def finish(self, records):
+        """Complete the record being read, if any"""
+        if self.current:
+            records.append((self.page, self.current))
+            self.count += 1
+            self.current = {}
+
+    def feed(self, line, records):
+        """Parse one stripped line, appending any record it completes to records"""
+        label, colon, value = line.partition(":")
+        field = FIELD_LABELS.get(label) if colon else None
+        if field is not None:
+            if field == "name":
+                self.finish(records)
+            self.current[field] = value.strip()
+            if field == "city":
+                self.finish(records)
+        elif colon and not value and label.startswith("page"):
+            self.finish(records)
+            try:
+                self.page = int(label[4:])
+                self.last_page = max(self.last_page, self.page)
+            except ValueError:
+                pass
+        elif line == "":
+            self.finish(records)
+
+def render_lawyers(paged_details, previous_page=None):
+    """Render (page, details) pairs as lawyer_names.txt text
+
+    A pageN: header is only written when the page differs from the previous
+    record's (or previous_page for the first one). Returns (text, last_page).
+    """
+    parts = []
+    for page, details in paged_details:
+        if page is not None and page != previous_page:
+            parts.append(f"page{page}:\n")
+            previous_page = page
+        parts.append(
+            f"שם: {details.get('name', '')}\n"
+            f"התמכות: {details.get('area_of_practice', '')}\n"
+            f"טלפון: {details.get('phone', '')}\n"
+            f"מייל: {details.get('email', '')}\n"
+            f"עיר: {details.get('city', '')}\n"
+            "\n"  # Empty line between entries
+        )
+    return "".join(parts), previous_page
+
+class LawyerFileTail:
+    """Tail-reader yielding the lawyers appended to lawyer_names.txt since the last call
+
+    A record or line still being written stays buffered until the rest of
+    it is appended. The file counts as rewritten when its inode changes, it
+    shrinks, or the bytes at its start or just before the parsed offset
+    differ from the ones read; writers that start over replace the file,
+    which changes its inode.
+    """
+
+    def __init__(self, filename="lawyer_names.txt"):
+        self.filepath = os.path.join(os.getcwd(), filename)
+        self.rewind()
+
+    def rewind(self):
+        """Forget everything read so far; the next read starts from byte 0"""
+        self.offset = 0
+        self.inode = None
+        self.head = b""
+        self.tail = b""  # Last bytes before offset
+        self.partial_line = b""
+        self.parser = LawyerRecordParser()
+
+    @property
+    def last_page(self):
+        return self.parser.last_page
+
+    @property
+    def count(self):
+        return self.parser.count
+
+    def _was_rewritten(self, f, file_stat):
+        """Return True if the file is not the one (or no longer the content) read so far"""
+        if self.offset == 0:
+            return False
+        if file_stat.st_ino != self.inode or file_stat.st_size < self.offset:
+            return True
+        f.seek(0)
+        if f.read(len(self.head)) != self.head:
+            return True
+        f.seek(self.offset - len(self.tail))
+        return f.read(len(self.tail)) != self.tail
+
+    def read_new(self):
+        """Parse the newly appended bytes
+
+        Returns (records, reset): records is a list of (page, details) in file
+        order; reset is True if the file was truncated or rewritten, in which
+        case records holds the whole file and earlier results must be dropped.
+        """
+        try:
+            file_stat = os.stat(self.filepath)
+        except OSError:
+            reset = self.offset > 0
+            self.rewind()
+            return [], reset
+
+        with open(self.filepath, "rb") as f:
+            reset = self._was_rewritten(f, file_stat)
+            if reset:
+                self.rewind()
+            if file_stat.st_size == self.offset:
+                return [], reset
+
+            f.seek(self.offset)
+            data = f.read()
+
+        self.inode = file_stat.st_ino
+        if len(self.head) < HEAD_CHECK_BYTES:
+            self.head = (self.head + data)[:HEAD_CHECK_BYTES]
+        self.tail = (self.tail + data)[-HEAD_CHECK_BYTES:]
+        self.offset += len(data)
+
+        lines = (self.partial_line + data).split(b"\n")
+        self.partial_line = lines.pop()  # Incomplete last line, if any
+
+        records = []
+        for raw_line in lines:
+            self.parser.feed(raw_line.decode("utf-8", errors="replace").strip(), records)
+        return records, reset
+
+def iter_lawyer_file(filename="lawyer_names.txt", parser=None):
+    """Yield (page, details) from lawyer_names.txt one record at a time, without loading the whole file
+
+    Pass a LawyerRecordParser to read the record count and last page once
+    the file has been consumed.
+    """
+    parser = parser or LawyerRecordParser()
+    filepath = os.path.join(os.getcwd(), filename)
+    if not os.path.exists(filepath):
+        return
+    records = []
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line in f:
+            parser.feed(line.strip(), records)
+            if records:
+                yield from records
+                records.clear()
+    parser.finish(records)
+    yield from records
+
+def scan_lawyer_file(filename="lawyer_names.txt"):
+    """Return (records, count, last_page) for lawyer_names.txt from a single pass
+
+    The result is cached until the file's size, modification time or inode
+    changes, so repeated calls do not read the file again.
+    """
+    filepath = os.path.join(os.getcwd(), filename)
+    try:
+        file_stat = os.stat(filepath)
+    except OSError:
+        return [], 0, 0
+    signature = (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+    with _scan_cache_lock:
+        cached = _scan_cache.get(filepath)
+        if cached and cached[0] == signature:
+            return cached[1:]
+
+    parser = LawyerRecordParser()
+    records = list(iter_lawyer_file(filename, parser))
+    with _scan_cache_lock:
+        _scan_cache[filepath] = (signature, records, parser.count, parser.last_page)
+    return records, parser.count, parser.last_page
@@ -0,0 +1,217 @@
+"""
+In-memory index over the scraped lawyers for the API.
+Maintained incrementally as records are added: positions by city, by area
+of practice and by presence of email/phone, plus running statistics with
+per-city, per-area and per-page breakdowns.
+"""
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+MAX_PAGE_SIZE = 1000  # Largest page a client can request from /api/lawyers
+DEFAULT_PAGE_SIZE = 100  # Page size of /api/lawyers when no limit is given
+
+SEARCH_DEFAULT_LIMIT = 50  # Results per page of /api/lawyers/search when no limit is given
+
+TOKEN_PATTERN = re.compile(r"\w+")
+# Hebrew abbreviation marks and quotes are dropped so עו"ד matches עוד
+TOKEN_STRIP = str.maketrans("", "", "'\"\u05f3\u05f4`")
+
+# Practice areas whose names contain a comma, so they must not be split
+KNOWN_COMPOUND_AREAS = ("ירושות, צוואות ועזבונות", 'כינוסים, פירוקים ופשט"ר')
+
+def split_areas(area_of_practice):
+    """Split a comma-separated area_of_practice value into individual areas"""
+    text = area_of_practice or ""
+    areas = []
+    for compound in KNOWN_COMPOUND_AREAS:
+        if compound in text:
+            areas.append(compound)
+            text = text.replace(compound, "")
+    areas.extend(area.strip() for area in text.split(",") if area.strip())
+    return areas
+
+def tokenize(text):
+    """Split text into lowercase search tokens (Hebrew and English words)"""
+    return TOKEN_PATTERN.findall((text or "").translate(TOKEN_STRIP).lower())
+
+class LawyerIndex:
+    """Lawyers in crawl order with posting lists of their positions
+
+    Positions only grow, so every posting list stays sorted.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.lawyers = []
+        self.by_city = defaultdict(list)
+        self.by_area = defaultdict(list)
+        self.with_email = []
+        self.with_phone = []
+        self.without_email = []
+        self.without_phone = []
+        self.by_page = defaultdict(int)  # lawyers saved per results page
+        self.by_token = defaultdict(list)  # search token -> positions
+        self.tokens = []  # sorted vocabulary, for prefix lookups
+        self._new_tokens = []  # tokens not yet merged into self.tokens
+        self.lawyer_tokens = []  # position -> that lawyer's tokens
+        self.by_id = {}  # stable lawyer ID -> position
+        self._stats_snapshot = None
+        self.stats = {
+            "total_lawyers": 0,
+            "with_email": 0,
+            "with_phone": 0,
+            "with_city": 0,
+            "with_area": 0
+        }
+
+    def add(self, lawyer, page=None):
+        """Append a lawyer and index it"""
+        position = len(self.lawyers)
+        self.lawyers.append(lawyer)
+        if lawyer.get('id'):
+            self.by_id[lawyer['id']] = position
+
+        city = (lawyer.get('city') or "").strip()
+        if city:
+            self.by_city[city].append(position)
+        for area in split_areas(lawyer.get('area_of_practice')):
+            self.by_area[area].append(position)
+        (self.with_email if lawyer.get('email') else self.without_email).append(position)
+        (self.with_phone if lawyer.get('phone') else self.without_phone).append(position)
+
+        self.stats["total_lawyers"] += 1
+        self.stats["with_email"] += 1 if lawyer.get('email') else 0
+        self.stats["with_phone"] += 1 if lawyer.get('phone') else 0
+        self.stats["with_city"] += 1 if city else 0
+        self.stats["with_area"] += 1 if lawyer.get('area_of_practice') else 0
+        if page is not None:
+            self.by_page[page] += 1
+
+        searchable = " ".join(lawyer.get(field) or "" for field in ("name", "city", "area_of_practice"))
+        tokens = tuple(set(tokenize(searchable)))
+        self.lawyer_tokens.append(tokens)
+        for token in tokens:
+            if token not in self.by_token:
+                self._new_tokens.append(token)
+            self.by_token[token].append(position)
+        self._stats_snapshot = None
+
+    def get_stats(self):
+        """Return the running counts with city, area and page breakdowns
+
+        The breakdowns are the posting list lengths, so nothing is scanned;
+        the result is reused until the next lawyer is added.
+        """
+        if self._stats_snapshot is None:
+            self._stats_snapshot = dict(
+                self.stats,
+                by_city={city: len(positions) for city, positions in self.by_city.items()},
+                by_area={area: len(positions) for area, positions in self.by_area.items()},
+                by_page={str(page): count for page, count in sorted(self.by_page.items())}
+            )
+        return self._stats_snapshot
+
+    def get(self, lawyer_id):
+        """Return the lawyer with this stable ID, or None"""
+        position = self.by_id.get(lawyer_id)
+        return None if position is None else self.lawyers[position]
+
+    def __len__(self):
+        return len(self.lawyers)
+
+    def query(self, city=None, area=None, has_email=None, has_phone=None, offset=0, limit=None):
+        """Return (total_matches, positions) for the filters, paged by offset/limit
+
+        Every filter has a posting list (has_email/has_phone=false use the
+        lists of lawyers without one), so the candidates are the smallest
+        list and the remaining filters are checked on those candidates only.
+        """
+        postings = []
+        if city is not None:
+            postings.append(self.by_city.get(city.strip(), []))
+        if area is not None:
+            postings.append(self.by_area.get(area.strip(), []))
+        if has_email is not None:
+            postings.append(self.with_email if has_email else self.without_email)
+        if has_phone is not None:
+            postings.append(self.with_phone if has_phone else self.without_phone)
+
+        checks = []
+        if city is not None:
+            checks.append(lambda lawyer: (lawyer.get('city') or "").strip() == city.strip())
+        if area is not None:
+            checks.append(lambda lawyer: area.strip() in split_areas(lawyer.get('area_of_practice')))
+        if has_email is not None:
+            checks.append(lambda lawyer: bool(lawyer.get('email')) == has_email)
+        if has_phone is not None:
+            checks.append(lambda lawyer: bool(lawyer.get('phone')) == has_phone)
+
+        if postings:
+            candidates = min(postings, key=len)
+        else:
+            candidates = range(len(self.lawyers))
+
+        if checks:
+            matches = [p for p in candidates if all(check(self.lawyers[p]) for check in checks)]
+        else:
+            matches = candidates
+
+        end = None if limit is None else offset + limit
+        return len(matches), list(matches[offset:end])
+
+    def _sorted_tokens(self):
+        """Return the sorted vocabulary, merging in tokens added since the last search
+
+        Sorting the already sorted list plus the new tokens is close to a
+        linear merge, and it only happens when a search follows new lawyers.
+        """
+        if self._new_tokens:
+            self.tokens = sorted(self.tokens + self._new_tokens)
+            self._new_tokens = []
+        return self.tokens
+
+    def _prefix_range(self, prefix):
+        """Return the (start, end) slice of the sorted vocabulary that starts with prefix"""
+        return bisect_left(self.tokens, prefix), bisect_left(self.tokens, prefix + "\U0010ffff")
+
+    def search(self, q, offset=0, limit=SEARCH_DEFAULT_LIMIT):
+        """Return (total_matches, positions) of lawyers matching every word of q
+
+        Each word matches as a prefix of a name, city or practice area token,
+        so partial input works for autocomplete. Results are in crawl order.
+        Only the word whose matching tokens cover the fewest positions is
+        expanded; the other words are checked against those candidates.
+        """
+        terms = set(tokenize(q))
+        if not terms:
+            return 0, []
+        tokens = self._sorted_tokens()
+        postings = {
+            term: [self.by_token[token] for token in tokens[slice(*self._prefix_range(term))]]
+            for term in terms
+        }
+        first = min(terms, key=lambda term: sum(len(positions) for positions in postings[term]))
+        matches = set()
+        for positions in postings[first]:
+            matches.update(positions)
+
+        others = terms - {first}
+        if others:
+            matches = [
+                p for p in matches
+                if all(any(token.startswith(term) for token in self.lawyer_tokens[p]) for term in others)
+            ]
+        matches = sorted(matches)
+        return len(matches), matches[offset:offset + limit]
+
+def project(lawyer, fields=None):
+    """Return a copy of a lawyer with only the requested fields (its stable ID is always kept)"""
+    if not fields:
+        return dict(lawyer)
+    projected = {field: lawyer.get(field, "") for field in fields}
+    if lawyer.get('id'):
+        projected['id'] = lawyer['id']
+    return projected
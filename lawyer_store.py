@@ -0,0 +1,382 @@
+"""
+SQLite storage for scraped lawyers.
+This is the primary store written by the scraper and read by the API;
+lawyer_names.txt and lawyer_names.xlsx are exports derived from it.
+"""
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from urllib.parse import unquote
+from lawyer_file import iter_lawyer_file, render_lawyers
+
+LAWYER_DB = os.getenv("LAWYER_DB_PATH", "lawyers.db")
+LAWYER_FIELDS = ["name", "area_of_practice", "phone", "email", "city"]
+
+LAWYER_PARAM_PATTERN = re.compile(r"[?&]lawyer=([^&#]+)")
+
+_store = None
+_store_lock = threading.Lock()
+
+def lawyer_id_from_url(detail_url):
+    """Return the stable ID of a lawyer from its lawyer-fd detail URL, or None
+
+    The ID is the site's own lawyer= token (e.g. 6DvM+ex3ew8) made URL-safe:
+    '+' and '/' become '-' and '_'.
+    """
+    match = LAWYER_PARAM_PATTERN.search(detail_url or "")
+    if not match:
+        return None
+    return unquote(match.group(1)).replace("+", "-").replace("/", "_").rstrip("=") or None
+
+class LawyerStore:
+    """Lawyers table with indexes on name, city, area of practice and email
+
+    Rows keep crawl order through their autoincrement id. The revision
+    counter in the meta table increases on every write, and the generation
+    counter whenever rows are deleted or updated, so readers can tell
+    appends apart from rewrites.
+    """
+
+    def __init__(self, filename=LAWYER_DB):
+        self.filepath = filename if os.path.isabs(filename) else os.path.join(os.getcwd(), filename)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.filepath, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS lawyers (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL DEFAULT '',
+                area_of_practice TEXT NOT NULL DEFAULT '',
+                phone TEXT NOT NULL DEFAULT '',
+                email TEXT NOT NULL DEFAULT '',
+                city TEXT NOT NULL DEFAULT '',
+                page INTEGER,
+                detail_url TEXT,
+                lawyer_id TEXT,
+                created_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_lawyers_name ON lawyers (name);
+            CREATE INDEX IF NOT EXISTS idx_lawyers_city ON lawyers (city);
+            CREATE INDEX IF NOT EXISTS idx_lawyers_area ON lawyers (area_of_practice);
+            CREATE INDEX IF NOT EXISTS idx_lawyers_email ON lawyers (email);
+            CREATE INDEX IF NOT EXISTS idx_lawyers_page ON lawyers (page);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO meta (key, value) VALUES ('revision', 0);
+            INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0);
+        """)
+        self._add_lawyer_id_column()
+        self._make_lawyer_id_unique()
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_lawyers_detail_url ON lawyers (detail_url)")
+        self._conn.commit()
+
+    def _add_lawyer_id_column(self):
+        """Add the lawyer_id column to databases created before it existed"""
+        columns = [row['name'] for row in self._conn.execute("PRAGMA table_info(lawyers)")]
+        if 'lawyer_id' in columns:
+            return
+        self._conn.execute("ALTER TABLE lawyers ADD COLUMN lawyer_id TEXT")
+        rows = self._conn.execute("SELECT id, detail_url FROM lawyers WHERE detail_url IS NOT NULL").fetchall()
+        self._conn.executemany(
+            "UPDATE lawyers SET lawyer_id = ? WHERE id = ?",
+            [(lawyer_id_from_url(row['detail_url']), row['id']) for row in rows]
+        )
+
+    def _make_lawyer_id_unique(self):
+        """Enforce one row per lawyer ID, keeping the latest row of IDs saved more than once"""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_lawyers_lawyer_id_unique'"
+        ).fetchone()
+        if exists:
+            return
+        removed = self._conn.execute(
+            "DELETE FROM lawyers WHERE lawyer_id IS NOT NULL AND id NOT IN "
+            "(SELECT MAX(id) FROM lawyers WHERE lawyer_id IS NOT NULL GROUP BY lawyer_id)"
+        ).rowcount
+        if removed:
+            self._bump_generation()
+            self._bump_revision()
+        self._conn.execute("DROP INDEX IF EXISTS idx_lawyers_lawyer_id")
+        self._conn.execute("CREATE UNIQUE INDEX idx_lawyers_lawyer_id_unique ON lawyers (lawyer_id)")
+
+    def _bump_revision(self):
+        self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'revision'")
+
+    def _bump_generation(self):
+        self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+
+    def _row(self, page_num, details, now):
+        return (
+            tuple(details.get(field, '') or '' for field in LAWYER_FIELDS)
+            + (page_num, details.get('detail_url'),
+               details.get('lawyer_id') or lawyer_id_from_url(details.get('detail_url')), now)
+        )
+
+    def _insert(self, paged_details, replace=False):
+        """Insert (page, details) pairs in one transaction, optionally replacing everything"""
+        now = time.time()
+        rows = [self._row(page_num, details, now) for page_num, details in paged_details]
+        with self._lock:
+            if replace:
+                self._conn.execute("DELETE FROM lawyers")
+                self._bump_generation()
+            self._conn.executemany(
+                "INSERT INTO lawyers (name, area_of_practice, phone, email, city, page, detail_url, lawyer_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._bump_revision()
+            self._conn.commit()
+
+    def _find(self, lawyer_id, detail_url):
+        """Return the row id of a saved lawyer with this ID (or detail URL when it has none), or None"""
+        if lawyer_id:
+            row = self._conn.execute("SELECT id FROM lawyers WHERE lawyer_id = ?", (lawyer_id,)).fetchone()
+        elif detail_url:
+            row = self._conn.execute("SELECT id FROM lawyers WHERE detail_url = ?", (detail_url,)).fetchone()
+        else:
+            row = None
+        return row['id'] if row else None
+
+    def add_lawyers(self, details_list, page_num=None):
+        """Save a batch of lawyers in one transaction and return the ones that are new
+
+        A lawyer's own 'page' (the results page it was found on) takes
+        precedence over the batch's page_num. A lawyer already in the store
+        (same lawyer ID, or same detail URL when it has no ID), such as one
+        whose failed detail fetch was retried, is updated in place.
+        """
+        now = time.time()
+        inserted, new_details, updated = [], [], []
+        batch_ids = {}  # lawyer ID -> position in inserted, for IDs repeated within the batch
+        with self._lock:
+            for details in details_list:
+                row = self._row(details.get('page', page_num), details, now)
+                row_id = self._find(row[7], row[6])
+                if row_id is None and row[7] in batch_ids:
+                    inserted[batch_ids[row[7]]] = row
+                elif row_id is None:
+                    if row[7]:
+                        batch_ids[row[7]] = len(inserted)
+                    inserted.append(row)
+                    new_details.append(details)
+                else:
+                    updated.append(row[:8] + (row_id,))
+            self._conn.executemany(
+                "INSERT INTO lawyers (name, area_of_practice, phone, email, city, page, detail_url, lawyer_id, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                inserted
+            )
+            if updated:
+                self._conn.executemany(
+                    "UPDATE lawyers SET name = ?, area_of_practice = ?, phone = ?, email = ?, city = ?, "
+                    "page = ?, detail_url = ?, lawyer_id = ? WHERE id = ?",
+                    updated
+                )
+                # Readers that only fetch appended rows must reload
+                self._bump_generation()
+            self._bump_revision()
+            self._conn.commit()
+        return new_details
+
+    def clear(self):
+        """Delete all lawyers"""
+        with self._lock:
+            self._conn.execute("DELETE FROM lawyers")
+            self._bump_generation()
+            self._bump_revision()
+            self._conn.commit()
+
+    def revision(self):
+        """Return the write counter; it changes whenever the data changes"""
+        with self._lock:
+            return self._conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()[0]
+
+    def version(self):
+        """Return (generation, revision, last_id) without touching the lawyers table's rows
+
+        last_id is None when the store is empty.
+        """
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+            last_id = self._conn.execute("SELECT MAX(id) FROM lawyers").fetchone()[0]
+        return meta['generation'], meta['revision'], last_id
+
+    def get_since(self, last_id=0):
+        """Return (id, page, lawyer) for the rows added after last_id, in crawl order
+
+        Each lawyer carries its stable ID under "id" when it has a detail URL.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, page, lawyer_id, name, area_of_practice, phone, email, city FROM lawyers "
+                "WHERE id > ? ORDER BY id",
+                (last_id,)
+            ).fetchall()
+        return [(row['id'], row['page'], row_to_lawyer(row)) for row in rows]
+
+    def is_empty(self):
+        with self._lock:
+            return self._conn.execute("SELECT NOT EXISTS (SELECT 1 FROM lawyers)").fetchone()[0] == 1
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM lawyers").fetchone()[0]
+
+    def iter_lawyers(self, batch_size=500):
+        """Yield (page, lawyer) in crawl order, reading batch_size rows at a time
+
+        The lock is only held while a batch is read, so the scraper can keep
+        writing while a long export is being streamed.
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, page, lawyer_id, name, area_of_practice, phone, email, city FROM lawyers "
+                    "WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row['page'], row_to_lawyer(row)
+            last_id = rows[-1]['id']
+
+    def max_lengths(self):
+        """Return the longest value of each field, then of the page number, in characters"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(LENGTH(name)), MAX(LENGTH(area_of_practice)), MAX(LENGTH(phone)), "
+                "MAX(LENGTH(email)), MAX(LENGTH(city)), MAX(LENGTH(CAST(page AS TEXT))) FROM lawyers"
+            ).fetchone()
+        return tuple(row)
+
+    def iter_pages(self):
+        """Yield (page, [lawyers]) groups in crawl order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page, name, area_of_practice, phone, email, city FROM lawyers ORDER BY id"
+            ).fetchall()
+        current_page, group = None, []
+        for row in rows:
+            if group and row['page'] != current_page:
+                yield current_page, group
+                group = []
+            current_page = row['page']
+            group.append({field: row[field] for field in LAWYER_FIELDS})
+        if group:
+            yield current_page, group
+
+    def import_text_file(self, filename="lawyer_names.txt"):
+        """Replace the store's contents with the lawyers in a lawyer_names.txt file"""
+        batches = list(iter_lawyer_file(filename))  # (page, details)
+        self._insert(batches, replace=True)
+        return len(batches)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def row_to_lawyer(row):
+    """Build a lawyer dict from a row that selected lawyer_id and the LAWYER_FIELDS"""
+    lawyer = {field: row[field] for field in LAWYER_FIELDS}
+    if row['lawyer_id']:
+        lawyer['id'] = row['lawyer_id']
+    return lawyer
+
+def get_store():
+    """Return the process-wide lawyer store, opening it on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LawyerStore()
+        return _store
+
+def export_text_file(store, filename="lawyer_names.txt"):
+    """Write all lawyers to a text file in the lawyer_names.txt format
+
+    The file is written under a temporary name and then replaces the old
+    one, so readers tailing it see a new file instead of changed content.
+    """
+    filepath = os.path.join(os.getcwd(), filename)
+    last_page = None
+    with open(filepath + ".tmp", "w", encoding="utf-8") as f:
+        for page, lawyers in store.iter_pages():
+            text, last_page = render_lawyers([(page, details) for details in lawyers], last_page)
+            f.write(text)
+    os.replace(filepath + ".tmp", filepath)
+    return filepath
+
+def export_excel_file(store, filename="lawyer_names.xlsx"):
+    """Write all lawyers to an Excel file with the scraper's column layout
+
+    Column widths come from one MAX(LENGTH()) query, so the rows can be
+    streamed from the store into a write-only workbook without keeping the
+    sheet in memory or measuring its cells.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment
+    from openpyxl.utils import get_column_letter
+
+    filepath = os.path.join(os.getcwd(), filename)
+    headers = ["שם", "התמחות", "טלפון", "מייל", "עיר", "דף"]
+    widths = [
+        max(len(header), length or 0)
+        for header, length in zip(headers, store.max_lengths())
+    ]
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Lawyers")
+    for col_num, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = min(width + 2, 50)
+
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = Font(bold=True)
+        cell.alignment = Alignment(horizontal='center')
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for page, details in store.iter_lawyers():
+        ws.append([details[field] for field in LAWYER_FIELDS] + [page if page else ''])
+
+    wb.save(filepath)
+    return filepath
+
+def count_excel_rows(filename="lawyer_names.xlsx"):
+    """Return the number of lawyer rows in an existing Excel file, or 0 if there is none"""
+    from openpyxl import load_workbook
+
+    filepath = os.path.join(os.getcwd(), filename)
+    if not os.path.exists(filepath):
+        return 0
+    wb = load_workbook(filepath, read_only=True)
+    try:
+        ws = wb.active
+        return sum(1 for row in ws.iter_rows(min_row=2, values_only=True) if any(row))
+    finally:
+        wb.close()
+
+if __name__ == "__main__":
+    # python lawyer_store.py import  - load lawyer_names.txt into the store
+    # python lawyer_store.py export  - regenerate lawyer_names.txt and .xlsx from the store
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    store = get_store()
+    if command == "import":
+        count = store.import_text_file()
+        print(f"✓ Imported {count} lawyers into {store.filepath}")
+    elif command == "export":
+        print(f"✓ Exported to {export_text_file(store)}")
+        print(f"✓ Exported to {export_excel_file(store)}")
+    else:
+        print("Usage: python lawyer_store.py [import|export]")
@@ -1,26 +1,42 @@
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+import re
 import time
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+
+# Label text of each field on a lawyer detail page (span.title followed by the value)
+DETAIL_FIELD_LABELS = {
+    "area_of_practice": "תחום עיסוק",
+    "phone": "טלפון נייד",
+    "email": 'דוא"ל',
+    "city": "ישוב",
+}
+
+CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
+META_CHARSET_BYTES = 2048  # Leading bytes searched for a <meta charset> declaration
+
+# Headers that mimic a real browser
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+}
 
 def create_session():
     """Create a requests session with proper headers and retry strategy"""
     session = requests.Session()
     
     # Set proper headers to mimic a real browser
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Cache-Control': 'max-age=0',
-    })
+    session.headers.update(BROWSER_HEADERS)
     
     # Set up retry strategy
     retry_strategy = Retry(
@@ -63,6 +79,118 @@ def scrape_url(url):
     finally:
         session.close()
 
+def session_from_driver(driver):
+    """Create a session that reuses the cookies of a Selenium driver's search session"""
+    session = create_session()
+    # requests only decodes brotli when the optional brotli package is installed,
+    # and lxml cannot parse an undecoded body
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+    sync_session_cookies(session, driver)
+    return session
+
+def sync_session_cookies(session, driver):
+    """Copy the current cookies of a Selenium driver into a requests session"""
+    try:
+        for cookie in driver.get_cookies():
+            session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+    except Exception as e:
+        print(f"⚠ Could not copy browser cookies: {e}")
+
+def _element_text(element):
+    """Return the whitespace-normalized text of an lxml element"""
+    return " ".join(element.text_content().split())
+
+def page_encoding(content_type, content):
+    """Return the charset to decode a fetched page with
+
+    The Content-Type header's charset wins; without one, None lets lxml use
+    the page's own <meta charset>, and pages declaring neither are read as
+    UTF-8 instead of lxml's Latin-1 default.
+    """
+    match = CHARSET_PATTERN.search(content_type or "")
+    if match:
+        return match.group(1)
+    if CHARSET_PATTERN.search(content[:META_CHARSET_BYTES].decode("ascii", errors="ignore")):
+        return None
+    return "utf-8"
+
+def parse_lawyer_details(html_content, encoding=None):
+    """Parse a lawyer detail page with lxml XPath
+
+    encoding decodes html_content when it is bytes (see page_encoding).
+    Returns the details dict, or None if none of the labelled fields were found.
+    """
+    details = {
+        "name": "",
+        "area_of_practice": "",
+        "phone": "",
+        "email": "",
+        "city": ""
+    }
+    
+    parser = lxml_html.HTMLParser(encoding=encoding) if encoding and isinstance(html_content, bytes) else None
+    tree = lxml_html.fromstring(html_content, parser=parser)
+    
+    # Same candidates as the Selenium extractor: h1, .lawyer-name, [class*='name'], .title
+    name_elems = tree.xpath(
+        "//h1 | //*[contains(@class, 'name')] | "
+        "//*[contains(concat(' ', normalize-space(@class), ' '), ' title ')]"
+    )
+    if name_elems:
+        details["name"] = _element_text(name_elems[0])
+    
+    found = False
+    for field, label in DETAIL_FIELD_LABELS.items():
+        labels = (
+            tree.xpath(f"//span[@class='title' and contains(text(), '{label}')]")
+            or tree.xpath(f"//span[contains(text(), '{label}')]")
+        )
+        if not labels:
+            continue
+        found = True
+        value_elems = labels[0].xpath("./following-sibling::*[self::span or self::a][1] | ../span[2]")
+        if not value_elems:
+            continue
+        value_elem = value_elems[0]
+        details[field] = _element_text(value_elem)
+        if field == "email" and not details[field]:
+            href = value_elem.get("href", "")
+            if href.startswith("mailto:"):
+                details[field] = href.replace("mailto:", "")
+    
+    # Fall back to any mailto link for the email; on its own it does not make
+    # the page a lawyer page (e.g. a mis-decoded page or a contact footer)
+    if not details["email"]:
+        mailto = tree.xpath("//a[starts-with(@href, 'mailto:')]/@href")
+        if mailto:
+            details["email"] = mailto[0].replace("mailto:", "")
+    
+    return details if found else None
+
+def fetch_lawyer_details(session, detail_url, timeout=15):
+    """Fetch and parse a lawyer detail page over plain HTTP
+
+    Returns the details dict, or None if the page could not be fetched or parsed.
+    """
+    try:
+        response = session.get(detail_url, timeout=timeout, allow_redirects=True)
+        if response.status_code != 200:
+            print(f"   ⚠ Detail page returned status code: {response.status_code}")
+            return None
+        encoding = page_encoding(response.headers.get('Content-Type'), response.content)
+        return parse_lawyer_details(response.content, encoding)
+    except requests.exceptions.RequestException as e:
+        print(f"   ⚠ Error fetching detail page: {e}")
+        return None
+    except Exception as e:
+        print(f"   ⚠ Error parsing detail page: {e}")
+        return None
+
 def parse_html(html_content):
     """Parse HTML content using BeautifulSoup"""
     if html_content:
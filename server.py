@@ -2,12 +2,21 @@
 Flask server to serve lawyer data via GET requests
 Also runs the scraper automatically
 """
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
 import os
+import io
+import csv
+import gzip
 import json
+import time
+import sqlite3
 import threading
-from browser_scraper import interactive_scraper, count_lawyers_in_file, get_last_page_from_file
+from datetime import datetime, timezone
+from browser_scraper import interactive_scraper
+from lawyer_store import get_store, LAWYER_FIELDS
+from lawyer_index import LawyerIndex, MAX_PAGE_SIZE, DEFAULT_PAGE_SIZE, SEARCH_DEFAULT_LIMIT, project
+from lawyer_file import LawyerFileTail, iter_lawyer_file
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
@@ -16,48 +25,181 @@ CORS(app)  # Enable CORS for all routes
 scraper_running = False
 scraper_thread = None
 
-def load_details_from_file(filename="lawyer_names.txt"):
-    """Load lawyer details from file and return as list (handles page headers)"""
+# Indexed lawyers and their statistics, refreshed only when the data changes
+_cache_lock = threading.Lock()
+_cache = {
+    "source": None,    # "store" or "file"
+    "version": None,   # store (generation, revision); unused for the file
+    "last_id": 0,      # last store row id included in the cache
+    "index": LawyerIndex(),
+    "last_page": 0,
+    "modified": None,  # time the cached data last changed
+}
+
+GZIP_MIN_SIZE = 1024  # Smaller responses are sent uncompressed
+
+_file_tail = LawyerFileTail()
+_store_error = None  # Why the lawyer store could not be opened, if it could not
+
+def open_store():
+    """Return the lawyer store, or None if it cannot be opened (e.g. a read-only deploy directory)"""
+    global _store_error
+    if _store_error is not None:
+        return None
     try:
-        filepath = os.path.join(os.getcwd(), filename)
-        if not os.path.exists(filepath):
-            return []
-        
-        details_list = []
-        current_detail = {}
-        
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip page headers like "page1:"
-                if line.startswith("page") and line.endswith(":"):
-                    continue
-                elif line.startswith("שם:"):
-                    if current_detail:  # Save previous detail
-                        details_list.append(current_detail)
-                    current_detail = {"name": line.replace("שם:", "").strip()}
-                elif line.startswith("התמכות:"):
-                    current_detail["area_of_practice"] = line.replace("התמכות:", "").strip()
-                elif line.startswith("טלפון:"):
-                    current_detail["phone"] = line.replace("טלפון:", "").strip()
-                elif line.startswith("מייל:"):
-                    current_detail["email"] = line.replace("מייל:", "").strip()
-                elif line.startswith("עיר:"):
-                    current_detail["city"] = line.replace("עיר:", "").strip()
-                elif line == "" and current_detail:
-                    # Empty line indicates end of entry
-                    if current_detail:
-                        details_list.append(current_detail)
-                        current_detail = {}
-            
-            # Add last detail if exists
-            if current_detail:
-                details_list.append(current_detail)
-        
-        return details_list
-    except Exception as e:
-        print(f"Error loading details from file: {e}")
-        return []
+        return get_store()
+    except sqlite3.Error as e:
+        _store_error = e
+        print(f"⚠ Could not open the lawyer store, serving lawyer_names.txt instead: {e}")
+        return None
+
+def refresh_from_store(store, generation, revision, last_id):
+    """Bring the cache up to date with the store, reading only new rows when possible"""
+    version = (generation, revision)
+    if _cache["source"] == "store" and _cache["version"] == version:
+        return
+    
+    index = _cache["index"]
+    if _cache["source"] == "store" and _cache["version"][0] == generation:
+        # Same generation: rows were only appended
+        rows = store.get_since(_cache["last_id"])
+    else:
+        index.clear()
+        _cache["last_page"] = 0
+        rows = store.get_since(0)
+    
+    for row_id, page, lawyer in rows:
+        index.add(lawyer, page)
+        _cache["last_page"] = max(_cache["last_page"], page or 0)
+    
+    _cache.update(
+        source="store",
+        version=version,
+        last_id=rows[-1][0] if rows else _cache["last_id"],
+        modified=time.time()
+    )
+
+def refresh_from_file():
+    """Bring the cache up to date with lawyer_names.txt, parsing only appended bytes
+
+    A truncated or rewritten file is parsed again from the start.
+    """
+    if _cache["source"] != "file":
+        _file_tail.rewind()
+    records, reset = _file_tail.read_new()
+    if _cache["source"] == "file" and not reset and not records:
+        return
+    
+    index = _cache["index"]
+    if _cache["source"] != "file" or reset:
+        index.clear()
+    
+    for page, lawyer in records:
+        index.add(lawyer, page)
+    
+    _cache.update(
+        source="file",
+        version=None,
+        last_id=0,
+        last_page=_file_tail.last_page,
+        modified=time.time()
+    )
+
+def refresh_dataset():
+    """Refresh the cached index if the data changed; call with _cache_lock held
+
+    Reads from the store, or from lawyer_names.txt while the store is empty
+    or cannot be opened. Checking for changes costs one small query, or one
+    stat() call and a read of the bytes appended since the last request.
+    """
+    store = open_store()
+    generation, revision, last_id = store.version() if store else (None, None, None)
+    if last_id is not None:
+        refresh_from_store(store, generation, revision, last_id)
+    else:
+        refresh_from_file()
+    return _cache["index"]
+
+def dataset_validators():
+    """Return (etag, last_modified) for the cached data; call with _cache_lock held
+
+    The ETag is the store's generation and revision, or the text file's
+    inode and parsed offset, so it changes exactly when the data does.
+    """
+    if _cache["source"] == "store":
+        generation, revision = _cache["version"]
+        etag = f"store-{generation}-{revision}"
+    else:
+        etag = f"file-{_file_tail.inode or 0}-{_file_tail.offset}"
+    return etag, int(_cache["modified"] or 0)
+
+def is_not_modified(etag, last_modified):
+    """Return True if the client's cached copy (If-None-Match / If-Modified-Since) is current"""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since:
+        return last_modified <= request.if_modified_since.timestamp()
+    return False
+
+def with_validators(response, etag, last_modified):
+    """Attach ETag/Last-Modified and ask clients to revalidate before reusing the response"""
+    response.set_etag(etag, weak=True)
+    response.last_modified = datetime.fromtimestamp(last_modified, tz=timezone.utc)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def not_modified_response(etag, last_modified):
+    return with_validators(Response(status=304), etag, last_modified)
+
+@app.after_request
+def compress_response(response):
+    """Gzip large responses for clients that accept it (streamed exports are sent as-is)"""
+    if (response.direct_passthrough or response.is_streamed or response.status_code != 200
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+def parse_bool_arg(name):
+    """Read a true/false query parameter; returns None when absent"""
+    value = request.args.get(name)
+    if value is None:
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    if value.lower() in ("0", "false", "no"):
+        return False
+    raise ValueError(f"{name} must be true or false")
+
+def parse_int_arg(name, default=None, maximum=None):
+    """Read a non-negative integer query parameter, capped at maximum"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer")
+    if number < 0:
+        raise ValueError(f"{name} must not be negative")
+    return min(number, maximum) if maximum is not None else number
+
+def parse_fields_arg():
+    """Read the comma-separated fields= projection; returns None for all fields"""
+    value = request.args.get('fields')
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in LAWYER_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(LAWYER_FIELDS)}")
+    return fields
 
 @app.route('/api/lawyers', methods=['GET'])
 def get_all_lawyers():
@@ -67,40 +209,167 @@ def get_all_lawyers():
     if os.getenv('VERCEL') == '1' and not scraper_running:
         run_scraper_on_startup()
     
-    lawyers = load_details_from_file()
-    return jsonify({
+    try:
+        offset = parse_int_arg('offset', default=0)
+        limit = parse_int_arg('limit', default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE)
+        has_email = parse_bool_arg('has_email')
+        has_phone = parse_bool_arg('has_phone')
+        fields = parse_fields_arg()
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    
+    with _cache_lock:
+        index = refresh_dataset()
+        etag, last_modified = dataset_validators()
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        total, positions = index.query(
+            city=request.args.get('city'),
+            area=request.args.get('area_of_practice'),
+            has_email=has_email,
+            has_phone=has_phone,
+            offset=offset,
+            limit=limit
+        )
+        data = [project(index.lawyers[position], fields) for position in positions]
+    
+    next_offset = offset + len(data)
+    return with_validators(jsonify({
         "success": True,
-        "count": len(lawyers),
-        "data": lawyers
-    })
+        "count": len(data),
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_offset": next_offset if next_offset < total else None,
+        "data": data
+    }), etag, last_modified)
 
-@app.route('/api/lawyers/<int:lawyer_id>', methods=['GET'])
-def get_lawyer_by_id(lawyer_id):
-    """Get a specific lawyer by index"""
-    lawyers = load_details_from_file()
-    if 0 <= lawyer_id < len(lawyers):
+def iter_export_lawyers():
+    """Yield every lawyer straight from storage, in crawl order"""
+    store = open_store()
+    if store is None or store.is_empty():
+        records = iter_lawyer_file()
+    else:
+        records = store.iter_lawyers()
+    for page, lawyer in records:
+        yield lawyer
+
+def generate_ndjson(lawyers, fields):
+    for lawyer in lawyers:
+        yield json.dumps(project(lawyer, fields), ensure_ascii=False) + "\n"
+
+def generate_csv(lawyers, fields):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction='ignore')
+    writer.writeheader()
+    for lawyer in lawyers:
+        writer.writerow({field: lawyer.get(field, "") for field in fields})
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+@app.route('/api/lawyers/export', methods=['GET'])
+def export_lawyers():
+    """Stream all lawyers as NDJSON (default) or CSV, one record at a time"""
+    export_format = request.args.get('format', 'ndjson').lower()
+    try:
+        fields = parse_fields_arg()
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    
+    if export_format == 'ndjson':
+        body = generate_ndjson(iter_export_lawyers(), fields)
+        mimetype = 'application/x-ndjson'
+    elif export_format == 'csv':
+        body = generate_csv(iter_export_lawyers(), fields or LAWYER_FIELDS)
+        mimetype = 'text/csv'
+    else:
         return jsonify({
+            "success": False,
+            "error": "format must be ndjson or csv"
+        }), 400
+    
+    response = Response(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename=lawyers.{export_format}'
+    return response
+
+@app.route('/api/lawyers/search', methods=['GET'])
+def search_lawyers():
+    """Search lawyers by name (Hebrew or English), city or practice area, matching word prefixes"""
+    q = request.args.get('q', '')
+    try:
+        offset = parse_int_arg('offset', default=0)
+        limit = parse_int_arg('limit', default=SEARCH_DEFAULT_LIMIT, maximum=MAX_PAGE_SIZE)
+        fields = parse_fields_arg()
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+    
+    with _cache_lock:
+        index = refresh_dataset()
+        etag, last_modified = dataset_validators()
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        total, positions = index.search(q, offset=offset, limit=limit)
+        data = [project(index.lawyers[position], fields) for position in positions]
+    
+    next_offset = offset + len(data)
+    return with_validators(jsonify({
+        "success": True,
+        "query": q,
+        "count": len(data),
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "next_offset": next_offset if next_offset < total else None,
+        "data": data
+    }), etag, last_modified)
+
+@app.route('/api/lawyers/<lawyer_id>', methods=['GET'])
+def get_lawyer_by_id(lawyer_id):
+    """Get a specific lawyer by stable ID, or by position for lawyers without one"""
+    with _cache_lock:
+        index = refresh_dataset()
+        etag, last_modified = dataset_validators()
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+        lawyer = index.get(lawyer_id)
+        if lawyer is None and lawyer_id.isdigit() and int(lawyer_id) < len(index):
+            # Only lawyers without a stable ID are addressed by position, so a
+            # stale or mistyped ID never returns a different lawyer
+            candidate = index.lawyers[int(lawyer_id)]
+            if not candidate.get('id'):
+                lawyer = candidate
+        total = len(index)
+    if lawyer is not None:
+        return with_validators(jsonify({
             "success": True,
-            "data": lawyers[lawyer_id]
-        })
+            "data": lawyer
+        }), etag, last_modified)
     else:
         return jsonify({
             "success": False,
-            "error": f"Lawyer with ID {lawyer_id} not found. Total lawyers: {len(lawyers)}"
+            "error": f"Lawyer with ID {lawyer_id} not found. Total lawyers: {total}"
         }), 404
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
-    """Get statistics about the lawyer data"""
-    lawyers = load_details_from_file()
-    return jsonify({
-        "success": True,
-        "total_lawyers": len(lawyers),
-        "with_email": sum(1 for l in lawyers if l.get('email')),
-        "with_phone": sum(1 for l in lawyers if l.get('phone')),
-        "with_city": sum(1 for l in lawyers if l.get('city')),
-        "with_area": sum(1 for l in lawyers if l.get('area_of_practice'))
-    })
+    """Get statistics about the lawyer data, with breakdowns by city, area of practice and page"""
+    with _cache_lock:
+        stats = refresh_dataset().get_stats()
+        etag, last_modified = dataset_validators()
+    if is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    return with_validators(jsonify(dict(success=True, **stats)), etag, last_modified)
 
 @app.route('/', methods=['GET'])
 def index():
@@ -108,9 +377,11 @@ def index():
     return jsonify({
         "message": "Lawyer Data API",
         "endpoints": {
-            "GET /api/lawyers": "Get all lawyers",
-            "GET /api/lawyers/<id>": "Get lawyer by index",
-            "GET /api/stats": "Get statistics",
+            "GET /api/lawyers": "Get lawyers, 100 per page; optional offset, limit (max 1000), city, area_of_practice, has_email, has_phone, fields=name,phone,...",
+            "GET /api/lawyers/export": "Stream all lawyers; format=ndjson (default) or csv, optional fields",
+            "GET /api/lawyers/search?q=": "Search names, cities and practice areas by word prefix; optional offset, limit, fields",
+            "GET /api/lawyers/<id>": "Get lawyer by stable ID (or by index for lawyers without one)",
+            "GET /api/stats": "Get statistics with counts by city, area of practice and page",
             "GET /api/scraper/status": "Get scraper status",
             "POST /api/scraper/start": "Start the scraper"
         }
@@ -119,8 +390,9 @@ def index():
 @app.route('/api/scraper/status', methods=['GET'])
 def scraper_status():
     """Get scraper status"""
-    existing_count = count_lawyers_in_file()
-    last_page = get_last_page_from_file()
+    with _cache_lock:
+        existing_count = len(refresh_dataset())
+        last_page = _cache["last_page"]
     return jsonify({
         "success": True,
         "running": scraper_running,
@@ -197,8 +469,10 @@ if __name__ == '__main__':
     print("🚀 Starting Lawyer Data Server")
     print("="*60)
     print("\nAvailable endpoints:")
-    print("  GET /api/lawyers - Get all lawyer data")
-    print("  GET /api/lawyers/<id> - Get specific lawyer by index")
+    print("  GET /api/lawyers - Get lawyer data (paginated and filtered via query parameters)")
+    print("  GET /api/lawyers/export - Stream all lawyers as NDJSON or CSV")
+    print("  GET /api/lawyers/search?q= - Search lawyers by name, city or practice area")
+    print("  GET /api/lawyers/<id> - Get specific lawyer by stable ID or index")
     print("  GET /api/stats - Get statistics")
     print("  GET /api/scraper/status - Get scraper status")
     print("  POST /api/scraper/start - Start scraper manually")
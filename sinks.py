@@ -0,0 +1,334 @@
+"""
+Export sinks the scraper writes saved lawyers to, besides the lawyer store.
+Each sink keeps its connection or file state between batches instead of
+reopening it for every 10 lawyers. PersistencePipeline runs them on
+background threads so exporting never blocks the crawl.
+
+A sink has a name, write_many(batches) taking (details_list, page_num, append)
+tuples, and close(); both raise on failure so the pipeline can retry them.
+"""
+import os
+import queue
+import threading
+import time
+import gspread
+from google.oauth2.service_account import Credentials
+from lawyer_store import count_excel_rows, export_excel_file
+from lawyer_file import render_lawyers
+
+SHEETS_SCOPES = ['https://spreadsheets.google.com/feeds',
+                 'https://www.googleapis.com/auth/drive']
+SHEETS_HEADERS = ["שם", "התמחות", "טלפון", "מייל", "עיר"]
+SHEETS_BATCH_SIZE = 100  # Buffered rows that trigger an append_rows call
+SHEETS_FLUSH_INTERVAL = 30  # Seconds after which buffered rows are sent anyway
+EXCEL_CHECKPOINT_ROWS = 500  # New lawyers that trigger a rewrite of the xlsx file
+EXCEL_CHECKPOINT_INTERVAL = 120  # Seconds after which the xlsx file is rewritten anyway
+TEXT_FILE_FSYNC = os.getenv("LAWYER_TXT_FSYNC", "0") == "1"  # fsync lawyer_names.txt after every write
+PERSIST_QUEUE_SIZE = 50  # Batches a sink may fall behind before the crawl waits for it
+PERSIST_RETRIES = 3  # Extra attempts for a failed write, with exponential backoff
+
+class TextFileSink:
+    """Appends lawyers to lawyer_names.txt with one write per call
+
+    All waiting batches are rendered into one buffer and appended with a
+    single write on an O_APPEND descriptor, so a killed process leaves no
+    half-written record behind a complete one. Starting over writes a new
+    file that replaces the old one, so tail readers see a new inode rather
+    than a file that kept its inode and grew back past their offset. Page
+    headers are written only when the page changes. With fsync, every write
+    is flushed to disk before the call returns.
+    """
+
+    name = "text file"
+
+    def __init__(self, filename="lawyer_names.txt", fsync=TEXT_FILE_FSYNC):
+        self.filepath = os.path.join(os.getcwd(), filename)
+        self.fsync = fsync
+        self.last_page = None  # Page of the last record written by this process
+
+    def write_many(self, batches):
+        truncate = False
+        paged_details = []
+        for details_list, page_num, append in batches:
+            if not append:
+                # Starting over: drop everything rendered before this batch
+                truncate = True
+                paged_details = []
+                self.last_page = None
+            paged_details.extend((details.get('page', page_num), details) for details in details_list)
+
+        text, last_page = render_lawyers(paged_details, self.last_page)
+        data = text.encode("utf-8")
+        if truncate:
+            path = self.filepath + ".tmp"
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        else:
+            path = self.filepath
+            flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if self.fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if truncate:
+            os.replace(path, self.filepath)
+        self.last_page = last_page
+        print(f"\n✓ Saved {len(paged_details)} lawyer details to: {self.filepath}")
+
+    def close(self):
+        pass
+
+class ExcelSink:
+    """Keeps lawyer_names.xlsx in step with the lawyer store
+
+    Instead of loading and re-measuring the workbook for every batch, the
+    file is regenerated from the store at checkpoints: after
+    EXCEL_CHECKPOINT_ROWS new lawyers, after EXCEL_CHECKPOINT_INTERVAL
+    seconds, and on close. An existing workbook is only replaced once the
+    store holds at least as many lawyers as it does.
+    """
+
+    name = "Excel"
+
+    def __init__(self, store, filename="lawyer_names.xlsx",
+                 checkpoint_rows=EXCEL_CHECKPOINT_ROWS, checkpoint_interval=EXCEL_CHECKPOINT_INTERVAL):
+        self.store = store
+        self.filename = filename
+        self.filepath = os.path.join(os.getcwd(), filename)
+        self.checkpoint_rows = checkpoint_rows
+        self.checkpoint_interval = checkpoint_interval
+        self.pending = 0  # Lawyers saved since the last checkpoint
+        self._exported_revision = None  # Store revision the file was last generated from
+        self._last_checkpoint = time.monotonic()
+
+    def write_many(self, batches):
+        self.pending += sum(len(details_list) for details_list, _, _ in batches)
+        if (self.pending >= self.checkpoint_rows
+                or time.monotonic() - self._last_checkpoint >= self.checkpoint_interval):
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Regenerate the workbook from the store, unless it already reflects the store"""
+        self.pending = 0
+        self._last_checkpoint = time.monotonic()
+        revision = self.store.revision()
+        if revision == self._exported_revision:
+            return
+        if self._exported_revision is None:
+            existing_rows = count_excel_rows(self.filename)
+            if existing_rows > self.store.count():
+                print(f"⚠ Not overwriting {self.filepath}: it has {existing_rows} lawyers, "
+                      f"the store only {self.store.count()}")
+                return
+        export_excel_file(self.store, self.filename)
+        self._exported_revision = revision
+        print(f"✓ Saved {self.store.count()} lawyer details to Excel: {self.filepath}")
+
+    def close(self):
+        # Also picks up lawyers updated in the store without being exported again
+        self.checkpoint()
+
+class GoogleSheetsSink:
+    """Buffered writer to the first worksheet of a Google Sheet
+
+    Authorizes and opens the worksheet once, reads the row count once, and
+    sends buffered rows with a single append_rows call when SHEETS_BATCH_SIZE
+    rows are waiting or SHEETS_FLUSH_INTERVAL seconds have passed. Rows that
+    fail to send stay buffered for the next flush, except in write_many,
+    which takes its batch back out and raises so the pipeline can retry it.
+    """
+
+    name = "Google Sheets"
+
+    def __init__(self, sheet_id, creds_file="credentials.json",
+                 batch_size=SHEETS_BATCH_SIZE, flush_interval=SHEETS_FLUSH_INTERVAL):
+        self.sheet_id = sheet_id
+        self.creds_file = os.path.join(os.getcwd(), creds_file)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.worksheet = None
+        self.row_count = 0  # Rows in the sheet, including the header
+        self.disabled = False
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the worksheet on first use; returns False if Sheets is not configured"""
+        if self.worksheet is not None:
+            return True
+        if self.disabled:
+            return False
+        if not os.path.exists(self.creds_file):
+            print("⚠ Google Sheets credentials.json not found. Skipping Google Sheets update.")
+            print("   To enable Google Sheets, create a service account and save credentials.json")
+            self.disabled = True
+            return False
+
+        creds = Credentials.from_service_account_file(self.creds_file, scopes=SHEETS_SCOPES)
+        client = gspread.authorize(creds)
+        worksheet = client.open_by_key(self.sheet_id).sheet1
+        # One column is enough to count the rows; this runs once per process
+        self.row_count = len(worksheet.col_values(1))
+        if self.row_count == 0:
+            worksheet.append_rows([SHEETS_HEADERS])
+            self.row_count = 1
+        self.worksheet = worksheet
+        return True
+
+    def add(self, details_list):
+        """Buffer lawyers, sending them if a size or time threshold is reached
+
+        Returns False if Google Sheets is not configured.
+        """
+        with self._lock:
+            if self.disabled:
+                return False
+            self._buffer.extend(self._rows(details_list))
+            if self._flush_due():
+                return self._flush()
+            return True
+
+    def write_many(self, batches):
+        rows = [row for details_list, _, _ in batches for row in self._rows(details_list)]
+        with self._lock:
+            if self.disabled:
+                return
+            self._buffer.extend(rows)
+            if self._flush_due():
+                try:
+                    self._send()
+                except Exception:
+                    # The pipeline retries these batches, which adds them again
+                    del self._buffer[len(self._buffer) - len(rows):]
+                    raise
+
+    def _rows(self, details_list):
+        return [[
+            details.get('name', ''),
+            details.get('area_of_practice', ''),
+            details.get('phone', ''),
+            details.get('email', ''),
+            details.get('city', '')
+        ] for details in details_list]
+
+    def _flush_due(self):
+        return (len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval)
+
+    def flush(self):
+        """Send all buffered rows now"""
+        with self._lock:
+            return self._flush()
+
+    def _flush(self):
+        try:
+            return self._send()
+        except Exception as e:
+            print(f"⚠ Error saving to Google Sheets: {e}")
+            print(f"   Keeping {len(self._buffer)} rows buffered for the next attempt...")
+            return False
+
+    def _send(self):
+        """Send the buffered rows; raises if they could not be sent, leaving them buffered
+
+        Returns False if Google Sheets is not configured.
+        """
+        if not self._buffer:
+            return True
+        if not self._connect():
+            self._buffer = []
+            return False
+        self.worksheet.append_rows(self._buffer)
+        self.row_count += len(self._buffer)
+        print(f"✓ Saved {len(self._buffer)} lawyers to Google Sheets (sheet now has {self.row_count} rows)")
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        return True
+
+    def close(self):
+        with self._lock:
+            self._send()
+
+class PersistencePipeline:
+    """Fans saved batches out to sinks, each drained by its own background thread
+
+    submit() only blocks when a sink is PERSIST_QUEUE_SIZE batches behind,
+    which slows the crawl down to what the slowest sink can absorb. A worker
+    takes every batch waiting in its queue and writes them with one
+    write_many call, retrying failures with backoff. close() waits until
+    every queued batch is written.
+    """
+
+    def __init__(self, sinks, queue_size=PERSIST_QUEUE_SIZE, retries=PERSIST_RETRIES):
+        self.sinks = sinks
+        self.retries = retries
+        self._queues = []
+        self._threads = []
+        self._closed = False
+        for sink in sinks:
+            sink_queue = queue.Queue(maxsize=queue_size)
+            thread = threading.Thread(target=self._worker, args=(sink, sink_queue), daemon=True)
+            thread.start()
+            self._queues.append(sink_queue)
+            self._threads.append(thread)
+
+    def submit(self, details_list, page_num=None, append=True):
+        """Queue a batch for every sink"""
+        batch = (list(details_list), page_num, append)
+        for sink_queue in self._queues:
+            sink_queue.put(batch)
+
+    def _worker(self, sink, sink_queue):
+        while True:
+            batch = sink_queue.get()
+            if batch is None:
+                break
+            batches = [batch]
+            stop = False
+            # Take everything else already waiting so it is written in one go
+            while True:
+                try:
+                    batch = sink_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    stop = True
+                    break
+                batches.append(batch)
+            count = sum(len(details_list) for details_list, _, _ in batches)
+            self._retry(sink, lambda: sink.write_many(batches), f"{count} lawyers")
+            if stop:
+                break
+        # Closing flushes what a sink still buffers, so it is retried the same way
+        self._retry(sink, sink.close, "the remaining lawyers")
+
+    def _retry(self, sink, write, what):
+        """Call write(), retrying failures with exponential backoff"""
+        for attempt in range(self.retries + 1):
+            try:
+                write()
+                return
+            except Exception as e:
+                if attempt == self.retries:
+                    print(f"✗ Error saving {what} to {sink.name}, giving up: {e}")
+                    print("   The lawyer store has them; run 'python lawyer_store.py export' to rebuild the exports")
+                    return
+                delay = 2 ** attempt
+                print(f"⚠ Error saving to {sink.name}: {e}. Retrying in {delay}s...")
+                time.sleep(delay)
+
+    def close(self):
+        """Write everything still queued, then stop the workers"""
+        if self._closed:
+            return
+        self._closed = True
+        for sink_queue in self._queues:
+            sink_queue.put(None)
+        for thread in self._threads:
+            thread.join()
@@ -0,0 +1,54 @@
+"""Tests for resuming a crawl from the lawyers saved by an earlier run"""
+import pytest
+import browser_scraper
+import lawyer_store
+
+def saved_lawyer(number, with_details=True):
+    return {
+        "name": f"L{number}",
+        "area_of_practice": "",
+        "phone": "050-0000000" if with_details else "",
+        "email": "",
+        "city": "",
+        "detail_url": f"https://www.israelbar.org.il/lawyer-fd/?lawyer=id{number}",
+        "lawyer_number": number,
+    }
+
+@pytest.fixture(autouse=True)
+def fresh_crawl(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(browser_scraper, "START_FROM_LAWYER_NUMBER", 1)
+    monkeypatch.setattr(browser_scraper, "_crawl_state", None)
+    monkeypatch.setattr(browser_scraper, "_pipelines", {})
+    monkeypatch.setattr(browser_scraper, "_sheets_sinks", {})
+    monkeypatch.setattr(lawyer_store, "_store", None)
+    yield
+    browser_scraper.close_persistence()
+    browser_scraper.get_crawl_state().close()
+    lawyer_store.get_store().close()
+
+def save_and_record(details_list, page_num):
+    """Save a batch and record the crawl position, as the extractors do"""
+    browser_scraper.save_batch(details_list, page_num)
+    last = details_list[-1]['lawyer_number']
+    browser_scraper.get_crawl_state().set_progress(page_num, last, 10)
+
+def test_resumes_after_the_last_saved_lawyer():
+    save_and_record([saved_lawyer(n) for n in range(1, 11)], 1)
+    save_and_record([saved_lawyer(n) for n in range(11, 16)], 2)
+    assert browser_scraper.get_start_lawyer_number() == 16
+    assert browser_scraper.get_crawl_state().is_done(saved_lawyer(3)['detail_url'], "L3")
+
+def test_resumes_from_the_first_lawyer_without_details():
+    save_and_record([saved_lawyer(n, with_details=n != 4) for n in range(1, 11)], 1)
+    assert browser_scraper.get_start_lawyer_number() == 4
+    assert not browser_scraper.get_crawl_state().is_done(saved_lawyer(4)['detail_url'], "L4")
+
+def test_retried_lawyer_is_updated_in_place():
+    save_and_record([saved_lawyer(n, with_details=n != 4) for n in range(1, 11)], 1)
+    save_and_record([saved_lawyer(4)], 1)
+    assert browser_scraper.get_start_lawyer_number() == 11
+    assert lawyer_store.get_store().count() == 10
+    browser_scraper.close_persistence()
+    with open("lawyer_names.txt", encoding="utf-8") as f:
+        assert f.read().count("שם: L4\n") == 1
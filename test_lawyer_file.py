@@ -0,0 +1,73 @@
+"""Tests for the incremental lawyer_names.txt reader"""
+import os
+from lawyer_file import LawyerFileTail, render_lawyers
+
+def lawyer(name):
+    return {"name": name, "area_of_practice": "", "phone": "", "email": "", "city": "תל אביב"}
+
+def write_lawyers(path, names, mode):
+    text, _ = render_lawyers([(1, lawyer(name)) for name in names], None if mode == "w" else 1)
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(text)
+
+def names(records):
+    return [details["name"] for page, details in records]
+
+def test_reads_only_appended_lawyers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_lawyers("lawyer_names.txt", ["a", "b"], "w")
+    tail = LawyerFileTail()
+    assert tail.read_new() == ([(1, lawyer("a")), (1, lawyer("b"))], False)
+
+    write_lawyers("lawyer_names.txt", ["c"], "a")
+    records, reset = tail.read_new()
+    assert names(records) == ["c"] and not reset
+    assert tail.read_new() == ([], False)
+    assert tail.count == 3 and tail.last_page == 1
+
+def test_partial_record_waits_for_the_rest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    text, _ = render_lawyers([(1, lawyer("a"))])
+    with open("lawyer_names.txt", "w", encoding="utf-8") as f:
+        f.write(text[:len(text) // 2])
+    tail = LawyerFileTail()
+    assert tail.read_new() == ([], False)
+
+    with open("lawyer_names.txt", "a", encoding="utf-8") as f:
+        f.write(text[len(text) // 2:])
+    assert names(tail.read_new()[0]) == ["a"]
+
+def test_rewrite_in_place_that_grows_past_offset(tmp_path, monkeypatch):
+    """Same inode and same first record, but different content before the old offset"""
+    monkeypatch.chdir(tmp_path)
+    write_lawyers("lawyer_names.txt", ["a", "b"], "w")
+    tail = LawyerFileTail()
+    tail.read_new()
+    inode = os.stat("lawyer_names.txt").st_ino
+
+    write_lawyers("lawyer_names.txt", ["a", "c", "d"], "w")
+    assert os.stat("lawyer_names.txt").st_ino == inode
+    records, reset = tail.read_new()
+    assert reset
+    assert names(records) == ["a", "c", "d"]
+
+def test_truncated_file_is_read_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_lawyers("lawyer_names.txt", ["a", "b"], "w")
+    tail = LawyerFileTail()
+    tail.read_new()
+
+    write_lawyers("lawyer_names.txt", ["x"], "w")
+    records, reset = tail.read_new()
+    assert reset and names(records) == ["x"]
+
+def test_replaced_file_is_read_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_lawyers("lawyer_names.txt", ["a", "b"], "w")
+    tail = LawyerFileTail()
+    tail.read_new()
+
+    write_lawyers("lawyer_names.txt.tmp", ["a", "b", "c"], "w")
+    os.replace("lawyer_names.txt.tmp", "lawyer_names.txt")
+    records, reset = tail.read_new()
+    assert reset and names(records) == ["a", "b", "c"]
@@ -0,0 +1,51 @@
+"""Tests for the tokenizer and prefix search of the API's lawyer index"""
+from lawyer_index import LawyerIndex, tokenize
+
+def make_index(*names_and_cities):
+    index = LawyerIndex()
+    for name, city in names_and_cities:
+        index.add({"name": name, "area_of_practice": "נדל\"ן, משפחה", "phone": "", "email": "", "city": city}, 1)
+    return index
+
+def test_tokenize_lowercases_and_drops_abbreviation_marks():
+    assert tokenize('עו"ד Moshe COHEN-Levi') == ["עוד", "moshe", "cohen", "levi"]
+    assert tokenize("גרש׳ גרשיים״") == ["גרש", "גרשיים"]
+    assert tokenize(None) == []
+
+def test_search_matches_word_prefixes_in_crawl_order():
+    index = make_index(("משה כהן", "תל אביב"), ("דוד לוי", "חיפה"), ("משה לוין", "חיפה"))
+    assert index.search("מש") == (3, [0, 1, 2])  # משפחה is a practice area
+    assert index.search("משה") == (2, [0, 2])
+    assert index.search("לוי") == (2, [1, 2])
+    assert index.search("נדל") == (3, [0, 1, 2])
+    assert index.search("xyz") == (0, [])
+    assert index.search("  ") == (0, [])
+
+def test_search_requires_every_word():
+    index = make_index(("משה כהן", "תל אביב"), ("דוד לוי", "חיפה"), ("משה לוין", "חיפה"))
+    assert index.search("משה חיפ") == (1, [2])
+    assert index.search("חיפה לוי") == (2, [1, 2])
+    assert index.search("משה דוד") == (0, [])
+
+def test_search_pages_results():
+    index = make_index(*[(f"משה {i}", "חיפה") for i in range(5)])
+    assert index.search("משה", offset=1, limit=2) == (5, [1, 2])
+    assert index.search("משה", offset=4, limit=2) == (5, [4])
+
+def test_search_sees_lawyers_added_after_a_search():
+    index = make_index(("משה כהן", "חיפה"))
+    assert index.search("אבר") == (0, [])
+    index.add({"name": "אברהם כהן", "city": "חיפה"}, 2)
+    assert index.search("אבר") == (1, [1])
+    assert index.search("כהן") == (2, [0, 1])
+
+def test_query_filters_on_missing_email_and_phone():
+    index = LawyerIndex()
+    index.add({"name": "א", "email": "a@example.com", "phone": "", "city": "חיפה"})
+    index.add({"name": "ב", "email": "", "phone": "050", "city": "חיפה"})
+    index.add({"name": "ג", "email": "", "phone": "", "city": "עכו"})
+    assert index.without_email == [1, 2] and index.without_phone == [0, 2]
+    assert index.query(has_email=False) == (2, [1, 2])
+    assert index.query(has_email=False, has_phone=False) == (1, [2])
+    assert index.query(city="חיפה", has_email=False) == (1, [1])
+    assert index.query(offset=1, limit=1) == (3, [1])
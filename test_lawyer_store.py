@@ -0,0 +1,47 @@
+"""Tests for the SQLite lawyer store"""
+import pytest
+from lawyer_store import LawyerStore, export_text_file
+
+def lawyer(number, phone=""):
+    return {
+        "name": f"L{number}",
+        "area_of_practice": "",
+        "phone": phone,
+        "email": "",
+        "city": "",
+        "detail_url": f"https://www.israelbar.org.il/lawyer-fd/?lawyer=id{number}",
+    }
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = LawyerStore("lawyers.db")
+    yield store
+    store.close()
+
+def test_appending_keeps_the_generation(store):
+    generation, revision, _ = store.version()
+    assert store.add_lawyers([lawyer(1), lawyer(2)], 1) == [lawyer(1), lawyer(2)]
+    new_generation, new_revision, last_id = store.version()
+    assert new_generation == generation and new_revision > revision and last_id == 2
+
+def test_known_lawyer_is_updated_in_place(store):
+    store.add_lawyers([lawyer(1), lawyer(2)], 1)
+    generation = store.version()[0]
+    assert store.add_lawyers([lawyer(2, phone="050-1234567"), lawyer(3)], 2) == [lawyer(3)]
+    assert store.count() == 3
+    assert store.version()[0] != generation
+    assert [details['phone'] for _, details in store.iter_lawyers()] == ["", "050-1234567", ""]
+
+def test_lawyer_repeated_within_a_batch_is_saved_once(store):
+    assert store.add_lawyers([lawyer(1), lawyer(1, phone="050-1234567")], 1) == [lawyer(1)]
+    assert [details['phone'] for _, details in store.iter_lawyers()] == ["050-1234567"]
+
+def test_text_file_round_trips_through_the_store(store):
+    store.add_lawyers([lawyer(1), lawyer(2)], 1)
+    store.add_lawyers([lawyer(3)], 2)
+    export_text_file(store)
+    imported = LawyerStore("imported.db")
+    assert imported.import_text_file() == 3
+    assert [(page, details['name']) for page, details in imported.iter_lawyers()] == [(1, "L1"), (1, "L2"), (2, "L3")]
+    imported.close()
@@ -0,0 +1,36 @@
+"""Tests for parsing lawyer detail pages fetched over HTTP"""
+from scraper import page_encoding, parse_lawyer_details
+
+DETAIL_PAGE = """<html><head>{meta}</head><body>
+<h1>עו"ד משה כהן</h1>
+<div><span class="title">תחום עיסוק</span><span>נדל"ן</span></div>
+<div><span class="title">טלפון נייד</span><span>050-1234567</span></div>
+<div><span class="title">דוא"ל</span><a href="mailto:moshe@example.com"></a></div>
+<div><span class="title">ישוב</span><span>חיפה</span></div>
+</body></html>"""
+
+def test_page_without_meta_charset_is_decoded_with_the_header_charset():
+    content = DETAIL_PAGE.format(meta="").encode("utf-8")
+    encoding = page_encoding("text/html; charset=utf-8", content)
+    details = parse_lawyer_details(content, encoding)
+    assert details == {
+        "name": 'עו"ד משה כהן',
+        "area_of_practice": 'נדל"ן',
+        "phone": "050-1234567",
+        "email": "moshe@example.com",
+        "city": "חיפה",
+    }
+
+def test_page_without_any_charset_is_read_as_utf8():
+    content = DETAIL_PAGE.format(meta="").encode("utf-8")
+    assert page_encoding("text/html", content) == "utf-8"
+    assert parse_lawyer_details(content, page_encoding("text/html", content))["city"] == "חיפה"
+
+def test_meta_charset_is_used_when_the_header_has_none():
+    content = DETAIL_PAGE.format(meta='<meta charset="windows-1255">').encode("windows-1255")
+    assert page_encoding("text/html", content) is None
+    assert parse_lawyer_details(content, None)["city"] == "חיפה"
+
+def test_mailto_link_alone_is_not_a_lawyer_page():
+    content = b'<html><body><h1>\xc3\x97</h1><a href="mailto:info@example.com">x</a></body></html>'
+    assert parse_lawyer_details(content, "iso-8859-1") is None
@@ -39,7 +39,7 @@ def test_scraper_integration():
     print()
     
     # Call the same function the scraper uses
-    result = save_details_to_google_sheets(sample_lawyers)
+    result = save_details_to_google_sheets(sample_lawyers, flush=True)
     
     if result:
         print()
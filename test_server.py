@@ -0,0 +1,61 @@
+"""Tests for the lawyer API served from the lawyer store"""
+import csv
+import io
+import json
+import pytest
+import lawyer_store
+import server
+from lawyer_file import LawyerFileTail
+from lawyer_index import LawyerIndex
+
+def lawyer(number, email=""):
+    return {
+        "name": f"L{number}",
+        "area_of_practice": "",
+        "phone": "",
+        "email": email,
+        "city": "חיפה",
+        "detail_url": f"https://www.israelbar.org.il/lawyer-fd/?lawyer=id{number}",
+    }
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(lawyer_store, "_store", None)
+    monkeypatch.setattr(server, "_store_error", None)
+    monkeypatch.setattr(server, "_file_tail", LawyerFileTail())
+    monkeypatch.setattr(server, "_cache", dict(server._cache, source=None, version=None, last_id=0,
+                                               index=LawyerIndex(), last_page=0, modified=None))
+    lawyer_store.get_store().add_lawyers([lawyer(1, "a@example.com"), lawyer(2)], 1)
+    yield server.app.test_client()
+    lawyer_store.get_store().close()
+
+def test_matching_etag_returns_not_modified(client):
+    response = client.get('/api/lawyers')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert client.get('/api/lawyers', headers={'If-None-Match': etag}).status_code == 304
+    lawyer_store.get_store().add_lawyers([lawyer(3)], 1)
+    assert client.get('/api/lawyers', headers={'If-None-Match': etag}).status_code == 200
+
+def test_lawyer_is_found_by_its_stable_id_only(client):
+    response = client.get('/api/lawyers/id2')
+    assert response.status_code == 200 and response.get_json()['data']['name'] == "L2"
+    # Lawyers with an ID are not addressed by position
+    assert client.get('/api/lawyers/0').status_code == 404
+    assert client.get('/api/lawyers/unknown').status_code == 404
+
+def test_export_streams_ndjson(client):
+    response = client.get('/api/lawyers/export')
+    assert response.mimetype == 'application/x-ndjson'
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)['name'] for line in lines] == ["L1", "L2"]
+
+def test_export_streams_csv_with_the_requested_fields(client):
+    response = client.get('/api/lawyers/export?format=csv&fields=name,email')
+    assert response.mimetype == 'text/csv'
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert rows == [{"name": "L1", "email": "a@example.com"}, {"name": "L2", "email": ""}]
+
+def test_export_rejects_unknown_formats(client):
+    assert client.get('/api/lawyers/export?format=xml').status_code == 400
@@ -0,0 +1,126 @@
+"""Tests for the export sinks and the background persistence pipeline"""
+import pytest
+import sinks
+from lawyer_store import LawyerStore, count_excel_rows, export_excel_file, export_text_file
+from sinks import ExcelSink, GoogleSheetsSink, PersistencePipeline, TextFileSink
+
+def lawyer(name):
+    return {"name": name, "area_of_practice": "", "phone": "", "email": "", "city": "חיפה"}
+
+class RecordingSink:
+    name = "recording"
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+        self.written = []
+        self.closed = False
+
+    def write_many(self, batches):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise IOError("disk full")
+        self.written.extend(details['name'] for details_list, _, _ in batches for details in details_list)
+
+    def close(self):
+        self.closed = True
+
+class FlakyWorksheet:
+    def __init__(self, failures):
+        self.failures = failures
+        self.rows = []
+
+    def append_rows(self, rows):
+        if self.failures:
+            self.failures -= 1
+            raise IOError("quota exceeded")
+        self.rows.extend(rows)
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(sinks.time, "sleep", lambda seconds: None)
+
+def test_close_writes_every_queued_batch():
+    sink = RecordingSink()
+    pipeline = PersistencePipeline([sink])
+    for i in range(20):
+        pipeline.submit([lawyer(f"L{i}")], 1)
+    pipeline.close()
+    assert sink.written == [f"L{i}" for i in range(20)]
+    assert sink.closed
+
+def test_failing_sink_is_retried():
+    sink = RecordingSink(failures=2)
+    pipeline = PersistencePipeline([sink], retries=3)
+    pipeline.submit([lawyer("a")], 1)
+    pipeline.close()
+    assert sink.calls == 3 and sink.written == ["a"]
+
+def test_failing_sink_gives_up_after_the_retries():
+    sink = RecordingSink(failures=10)
+    pipeline = PersistencePipeline([sink], retries=2)
+    pipeline.submit([lawyer("a")], 1)
+    pipeline.close()
+    assert sink.calls == 3 and sink.written == []
+    assert sink.closed
+
+def test_text_sink_writes_page_headers_only_on_page_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = TextFileSink()
+    sink.write_many([([lawyer("a")], 1, False)])
+    sink.write_many([([lawyer("b")], 1, True), ([lawyer("c")], 2, True)])
+    text = (tmp_path / "lawyer_names.txt").read_text(encoding="utf-8")
+    assert text.count("page1:") == 1 and text.count("page2:") == 1
+    assert text.index("page2:") > text.index("שם: b")
+
+def test_text_sink_starts_over_without_append(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sink = TextFileSink()
+    sink.write_many([([lawyer("a")], 1, False)])
+    sink.write_many([([lawyer("b")], 1, False)])
+    text = (tmp_path / "lawyer_names.txt").read_text(encoding="utf-8")
+    assert "שם: a" not in text and text.startswith("page1:\nשם: b")
+
+def test_sheets_rows_are_sent_once_after_a_retried_failure():
+    sheets = GoogleSheetsSink("sheet", batch_size=2)
+    sheets.worksheet = FlakyWorksheet(failures=1)
+    pipeline = PersistencePipeline([sheets])
+    pipeline.submit([lawyer("a"), lawyer("b")], 1)
+    pipeline.close()
+    assert [row[0] for row in sheets.worksheet.rows] == ["a", "b"]
+
+def test_sheets_close_raises_when_the_final_flush_fails():
+    sheets = GoogleSheetsSink("sheet", batch_size=100)
+    sheets.worksheet = FlakyWorksheet(failures=1)
+    sheets.add([lawyer("a")])
+    with pytest.raises(IOError):
+        sheets.close()
+    sheets.close()
+    assert [row[0] for row in sheets.worksheet.rows] == ["a"]
+def write_existing_crawl(count):
+    """Leave lawyer_names.txt and lawyer_names.xlsx behind as an earlier crawl would"""
+    earlier = LawyerStore("earlier.db")
+    earlier.add_lawyers([lawyer(f"L{i}") for i in range(count)], 1)
+    export_text_file(earlier)
+    export_excel_file(earlier)
+    earlier.close()
+
+def test_checkpoint_keeps_a_workbook_with_more_lawyers_than_the_store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_existing_crawl(5)
+    store = LawyerStore("lawyers.db")
+    store.add_lawyers([lawyer("new")], 2)
+    ExcelSink(store).close()
+    assert count_excel_rows() == 5
+    store.close()
+
+def test_checkpoint_replaces_the_workbook_once_the_store_is_seeded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_existing_crawl(5)
+    store = LawyerStore("lawyers.db")
+    store.import_text_file()
+    store.add_lawyers([lawyer("new")], 2)
+    ExcelSink(store).close()
+    assert count_excel_rows() == 6
+    store.close()